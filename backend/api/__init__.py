@@ -4,6 +4,7 @@ API package for SimpleCP.
 Contains REST API implementation:
 - models: Pydantic models for request/response validation
 - endpoints: API route handlers
+- middleware: ASGI request tracking middleware
 - server: FastAPI application setup
 """
 
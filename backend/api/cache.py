@@ -0,0 +1,80 @@
+"""
+Response cache for SimpleCP REST API.
+
+Keeps pre-serialized JSON bodies for read-only endpoints. Entries are keyed
+by route, parameters and the clipboard manager's data version, so any
+mutation makes older entries unreachable without explicit invalidation.
+Values that are cheap to serve slightly stale (health probes) use a TTL.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+import orjson
+
+
+class ResponseCache:
+    """Bounded LRU cache of encoded JSON response bodies."""
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize ResponseCache.
+
+        Args:
+            maxsize: Maximum number of cached bodies before evicting the oldest
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Get cached body for key, marking it as recently used."""
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: Hashable, data: Any) -> bytes:
+        """Encode data as JSON, store it under key and return the bytes."""
+        body = orjson.dumps(data)
+        self._entries[key] = body
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return body
+
+    def clear(self):
+        """Drop all cached bodies."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return number of cached bodies."""
+        return len(self._entries)
+
+
+class TTLValue:
+    """A single computed value that is refreshed at most once per ttl seconds."""
+
+    def __init__(self, compute: Callable[[], Any], ttl: float):
+        """
+        Initialize TTLValue.
+
+        Args:
+            compute: Zero-argument callable producing the value
+            ttl: Seconds a computed value stays fresh
+        """
+        self.compute = compute
+        self.ttl = ttl
+        self._value: Any = None
+        self._expires_at = 0.0
+
+    def get(self) -> Any:
+        """Return the cached value, recomputing it once it has expired."""
+        now = time.monotonic()
+        if now >= self._expires_at:
+            self._value = self.compute()
+            self._expires_at = now + self.ttl
+        return self._value
+
+    def invalidate(self):
+        """Force the next get() to recompute."""
+        self._expires_at = 0.0
@@ -1,70 +1,132 @@
 """API endpoints for SimpleCP REST API."""
-from fastapi import APIRouter, HTTPException
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from itertools import islice
+from starlette.concurrency import run_in_threadpool
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+import orjson
 from api.models import (ClipboardItemResponse, HistoryFolderResponse, CreateSnippetRequest,
-    UpdateSnippetRequest, MoveSnippetRequest, CreateFolderRequest, RenameFolderRequest,
+    BulkCreateSnippetsRequest, UpdateSnippetRequest, MoveSnippetRequest, CreateFolderRequest, RenameFolderRequest,
     CopyRequest, SearchResponse, StatsResponse, SnippetFolderResponse, SuccessResponse,
-    StatusResponse, ExportData, ImportRequest, SearchRequest, clipboard_item_to_response)
+    StatusResponse, ExportData, ImportRequest, SearchRequest, clipboard_items_to_dicts)
+from api.cache import ResponseCache
+
+# HTTP status for each SnippetStore.rename_folder error code
+RENAME_ERROR_STATUS = {
+    "SOURCE_NOT_FOUND": 404,
+    "TARGET_EXISTS": 409,
+    "SOURCE_EMPTY": 400,
+    "TARGET_EMPTY": 400,
+    "SAME_NAME": 400,
+}
+
+# Responses with at least this many items are streamed instead of cached
+STREAM_MIN_ITEMS = 500
+STREAM_BATCH_SIZE = 100
+
+
+def stream_json_array(
+    items: Iterable[Any],
+    encode: Callable[[List[Any]], List[Any]],
+    prefix: bytes = b"",
+    suffix: bytes = b"",
+) -> Iterator[bytes]:
+    """Yield prefix + a JSON array of encoded items + suffix, one batch at a time."""
+    items = iter(items)
+    yield prefix + b"["
+    separator = b""
+    while batch := list(islice(items, STREAM_BATCH_SIZE)):
+        # Drop the batch's own brackets so batches join into one array
+        yield separator + orjson.dumps(encode(batch))[1:-1]
+        separator = b","
+    yield b"]" + suffix
 
 
 def create_router(clipboard_manager):
     router = APIRouter()
+    response_cache = ResponseCache()
+    # Separate cache so bursts of typed-ahead queries don't evict list bodies
+    search_cache = ResponseCache(maxsize=256)
+
+    async def cached_json(key, build, cache=response_cache):
+        """Serve key from the response cache, building it in the threadpool on a miss."""
+        key = (*key, clipboard_manager.version)
+        body = cache.get(key)
+        if body is None:
+            body = cache.put(key, await run_in_threadpool(build))
+        return Response(content=body, media_type="application/json")
+
+    def search_results(query: str, include_history: bool = True, include_snippets: bool = True):
+        """Build search response, reusing results for repeated queries."""
+        def build():
+            results = clipboard_manager.search_all(query)
+            return {
+                "history": clipboard_items_to_dicts(results["history"] if include_history else []),
+                "snippets": clipboard_items_to_dicts(results["snippets"] if include_snippets else []),
+            }
+        # Matching is case-insensitive, so queries differing only in case share an entry
+        key = ("search", query.lower(), include_history, include_snippets)
+        return cached_json(key, build, cache=search_cache)
 
     @router.get("/api/history", response_model=List[ClipboardItemResponse])
     async def get_history(limit: Optional[int] = None):
-        return [clipboard_item_to_response(item) for item in clipboard_manager.get_all_history(limit)]
+        if (limit is None or limit >= STREAM_MIN_ITEMS) and len(
+            clipboard_manager.history_store
+        ) >= STREAM_MIN_ITEMS:
+            return StreamingResponse(
+                stream_json_array(clipboard_manager.iter_history(limit), clipboard_items_to_dicts),
+                media_type="application/json",
+            )
+
+        def build():
+            return clipboard_items_to_dicts(clipboard_manager.get_all_history(limit))
+        return await cached_json(("history", limit), build)
 
     @router.get("/api/history/recent", response_model=List[ClipboardItemResponse])
     async def get_recent_history():
-        return [clipboard_item_to_response(item) for item in clipboard_manager.get_recent_history()]
+        return ORJSONResponse(clipboard_items_to_dicts(clipboard_manager.get_recent_history()))
 
     @router.get("/api/history/folders", response_model=List[HistoryFolderResponse])
     async def get_history_folders():
-        folders = clipboard_manager.get_history_folders()
-        result = []
-        for folder in folders:
-            result.append(
-                HistoryFolderResponse(
-                    name=folder["name"],
-                    start_index=folder["start_index"],
-                    end_index=folder["end_index"],
-                    count=folder["count"],
-                    items=[
-                        clipboard_item_to_response(item) for item in folder["items"]
-                    ],
-                )
-            )
-        return result
+        def build():
+            return [
+                {
+                    "name": folder["name"],
+                    "start_index": folder["start_index"],
+                    "end_index": folder["end_index"],
+                    "count": folder["count"],
+                    "items": clipboard_items_to_dicts(folder["items"]),
+                }
+                for folder in clipboard_manager.get_history_folders()
+            ]
+        return await cached_json(("history_folders",), build)
 
     @router.delete("/api/history/{clip_id}", response_model=SuccessResponse)
     async def delete_history_item(clip_id: str):
-        success = clipboard_manager.delete_history_item(clip_id)
+        success = await run_in_threadpool(clipboard_manager.delete_history_item, clip_id)
         if not success:
             raise HTTPException(status_code=404, detail="Item not found")
         return SuccessResponse(success=True, message="Item deleted")
 
     @router.delete("/api/history", response_model=SuccessResponse)
     async def clear_history():
-        clipboard_manager.clear_history()
+        await run_in_threadpool(clipboard_manager.clear_history)
         return SuccessResponse(success=True, message="History cleared")
 
     @router.get("/api/snippets", response_model=List[SnippetFolderResponse])
     async def get_all_snippets():
-        snippets_by_folder = clipboard_manager.get_all_snippets()
-        result = []
-        for folder_name, items in snippets_by_folder.items():
-            result.append(
-                SnippetFolderResponse(
-                    folder_name=folder_name,
-                    snippets=[clipboard_item_to_response(item) for item in items],
-                )
-            )
-        return result
+        def build():
+            snippets_by_folder = clipboard_manager.get_all_snippets()
+            return [
+                {"folder_name": folder_name, "snippets": clipboard_items_to_dicts(items)}
+                for folder_name, items in snippets_by_folder.items()
+            ]
+        return await cached_json(("snippets",), build)
 
     @router.get("/api/snippets/folders", response_model=List[str])
     async def get_snippet_folders():
         """Get all snippet folder names."""
-        return clipboard_manager.get_snippet_folders()
+        return await cached_json(("snippet_folders",), clipboard_manager.get_snippet_folders)
 
     @router.get(
         "/api/snippets/{folder_name}",
@@ -73,7 +135,7 @@ def create_router(clipboard_manager):
     async def get_folder_snippets(folder_name: str):
         """Get all snippets in a specific folder."""
         items = clipboard_manager.get_folder_snippets(folder_name)
-        return [clipboard_item_to_response(item) for item in items]
+        return ORJSONResponse(clipboard_items_to_dicts(items))
 
     @router.post("/api/snippets", response_model=ClipboardItemResponse)
     async def create_snippet(request: CreateSnippetRequest):
@@ -84,8 +146,9 @@ def create_router(clipboard_manager):
                 raise HTTPException(
                     status_code=400, detail="clip_id cannot be empty"
                 )
-            snippet = clipboard_manager.save_as_snippet(
-                request.clip_id, request.name, request.folder, request.tags
+            snippet = await run_in_threadpool(
+                clipboard_manager.save_as_snippet,
+                request.clip_id, request.name, request.folder, request.tags,
             )
             if not snippet:
                 raise HTTPException(status_code=404, detail="History item not found")
@@ -96,8 +159,9 @@ def create_router(clipboard_manager):
                     status_code=400, detail="content cannot be empty"
                 )
             try:
-                snippet = clipboard_manager.add_snippet_direct(
-                    request.content, request.name, request.folder, request.tags
+                snippet = await run_in_threadpool(
+                    clipboard_manager.add_snippet_direct,
+                    request.content, request.name, request.folder, request.tags,
                 )
             except ValueError as e:
                 raise HTTPException(status_code=400, detail=str(e))
@@ -105,15 +169,28 @@ def create_router(clipboard_manager):
             raise HTTPException(
                 status_code=400, detail="Either clip_id or content required"
             )
-        return clipboard_item_to_response(snippet)
+        return ORJSONResponse(snippet.to_response_dict())
+
+    @router.post("/api/snippets/bulk", response_model=List[ClipboardItemResponse])
+    async def create_snippets_bulk(request: BulkCreateSnippetsRequest):
+        """Create many snippets directly, saving once for the whole batch."""
+        try:
+            snippets = await run_in_threadpool(
+                clipboard_manager.add_snippets_bulk,
+                [snippet.model_dump() for snippet in request.snippets],
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return ORJSONResponse(clipboard_items_to_dicts(snippets))
 
     @router.put("/api/snippets/{folder_name}/{clip_id}", response_model=SuccessResponse)
     async def update_snippet(
         folder_name: str, clip_id: str, request: UpdateSnippetRequest
     ):
         """Update snippet properties."""
-        success = clipboard_manager.update_snippet(
-            folder_name, clip_id, request.content, request.name, request.tags
+        success = await run_in_threadpool(
+            clipboard_manager.update_snippet,
+            folder_name, clip_id, request.content, request.name, request.tags,
         )
         if not success:
             raise HTTPException(status_code=404, detail="Snippet not found")
@@ -124,7 +201,7 @@ def create_router(clipboard_manager):
     )
     async def delete_snippet(folder_name: str, clip_id: str):
         """Delete specific snippet."""
-        success = clipboard_manager.delete_snippet(folder_name, clip_id)
+        success = await run_in_threadpool(clipboard_manager.delete_snippet, folder_name, clip_id)
         if not success:
             raise HTTPException(status_code=404, detail="Snippet not found")
         return SuccessResponse(success=True, message="Snippet deleted")
@@ -135,24 +212,24 @@ def create_router(clipboard_manager):
     )
     async def move_snippet(folder_name: str, clip_id: str, request: MoveSnippetRequest):
         """Move snippet to different folder."""
-        success = clipboard_manager.move_snippet(
-            folder_name, request.to_folder, clip_id
+        success = await run_in_threadpool(
+            clipboard_manager.move_snippet, folder_name, request.to_folder, clip_id
         )
         if not success:
             raise HTTPException(status_code=404, detail="Snippet not found")
         return SuccessResponse(success=True, message="Snippet moved")
 
     # Folder endpoints
-    @router.get("/api/folders", response_model=List[str])
-    async def get_folders():
-        """Get list of all snippet folders."""
-        folders = clipboard_manager.get_snippet_folders()
-        return folders
+    router.add_api_route(
+        "/api/folders", get_snippet_folders, methods=["GET"], response_model=List[str]
+    )
 
     @router.post("/api/folders", response_model=SuccessResponse)
     async def create_folder(request: CreateFolderRequest):
         """Create new snippet folder."""
-        success = clipboard_manager.create_snippet_folder(request.folder_name)
+        success = await run_in_threadpool(
+            clipboard_manager.create_snippet_folder, request.folder_name
+        )
         if not success:
             raise HTTPException(status_code=409, detail="Folder already exists")
         return SuccessResponse(success=True, message="Folder created")
@@ -160,22 +237,17 @@ def create_router(clipboard_manager):
     @router.put("/api/folders/{folder_name}", response_model=SuccessResponse)
     async def rename_folder(folder_name: str, request: RenameFolderRequest):
         """Rename snippet folder with detailed error handling."""
-        result = clipboard_manager.rename_snippet_folder(folder_name, request.new_name)
+        result = await run_in_threadpool(
+            clipboard_manager.rename_snippet_folder, folder_name, request.new_name
+        )
 
         if not result["success"]:
             error_code = result.get("error", "UNKNOWN_ERROR")
             error_message = result.get("message", "Unknown error occurred")
-
-            # Map specific errors to appropriate HTTP status codes
-            if error_code == "SOURCE_NOT_FOUND":
-                raise HTTPException(status_code=404, detail=error_message)
-            elif error_code == "TARGET_EXISTS":
-                raise HTTPException(status_code=409, detail=error_message)
-            elif error_code in ["SOURCE_EMPTY", "TARGET_EMPTY", "SAME_NAME"]:
-                raise HTTPException(status_code=400, detail=error_message)
-            else:
-                # Generic server error for unexpected failures
-                raise HTTPException(status_code=500, detail=error_message)
+            # Unexpected failures map to a generic server error
+            raise HTTPException(
+                status_code=RENAME_ERROR_STATUS.get(error_code, 500), detail=error_message
+            )
 
         return SuccessResponse(
             success=True,
@@ -185,7 +257,7 @@ def create_router(clipboard_manager):
     @router.delete("/api/folders/{folder_name}", response_model=SuccessResponse)
     async def delete_folder(folder_name: str):
         """Delete snippet folder and all its snippets."""
-        success = clipboard_manager.delete_snippet_folder(folder_name)
+        success = await run_in_threadpool(clipboard_manager.delete_snippet_folder, folder_name)
         if not success:
             raise HTTPException(status_code=404, detail="Folder not found")
         return SuccessResponse(success=True, message="Folder deleted")
@@ -194,7 +266,7 @@ def create_router(clipboard_manager):
     @router.post("/api/clipboard/copy", response_model=SuccessResponse)
     async def copy_to_clipboard(request: CopyRequest):
         """Copy item to system clipboard by ID."""
-        success = clipboard_manager.copy_to_clipboard(request.clip_id)
+        success = await run_in_threadpool(clipboard_manager.copy_to_clipboard, request.clip_id)
         if not success:
             raise HTTPException(status_code=404, detail="Item not found")
         return SuccessResponse(success=True, message="Copied to clipboard")
@@ -203,18 +275,15 @@ def create_router(clipboard_manager):
     @router.get("/api/search", response_model=SearchResponse)
     async def search(q: str):
         """Search across history and snippets."""
-        results = clipboard_manager.search_all(q)
-        return SearchResponse(
-            history=[clipboard_item_to_response(item) for item in results["history"]],
-            snippets=[clipboard_item_to_response(item) for item in results["snippets"]],
-        )
+        return await search_results(q)
 
     # Stats endpoint
     @router.get("/api/stats", response_model=StatsResponse)
     async def get_stats():
         """Get manager statistics."""
-        stats = clipboard_manager.get_stats()
-        return StatsResponse(**stats)
+        def build():
+            return StatsResponse(**clipboard_manager.get_stats()).model_dump()
+        return await cached_json(("stats",), build)
 
     # Status endpoint
     @router.get("/api/status", response_model=StatusResponse)
@@ -227,14 +296,34 @@ def create_router(clipboard_manager):
     @router.get("/api/export", response_model=ExportData)
     async def export_snippets():
         """Export all snippets."""
-        export_data = clipboard_manager.export_snippets()
-        return ExportData(**export_data)
+        # export_date is stamped per response; only the snippets are cached
+        envelope = orjson.dumps(clipboard_manager.export_envelope())
+        prefix = envelope[:-1] + b',"snippets":'
+        if len(clipboard_manager.snippet_store) >= STREAM_MIN_ITEMS:
+            return StreamingResponse(
+                stream_json_array(
+                    clipboard_manager.iter_snippets(),
+                    lambda batch: [item.to_dict() for item in batch],
+                    prefix=prefix,
+                    suffix=b"}",
+                ),
+                media_type="application/json",
+            )
+
+        def build():
+            return [item.to_dict() for item in clipboard_manager.iter_snippets()]
+        snippets = await cached_json(("export",), build)
+        return Response(content=prefix + snippets.body + b"}", media_type="application/json")
 
     # Import endpoint
     @router.post("/api/import", response_model=SuccessResponse)
     async def import_snippets(request: ImportRequest):
         """Import snippets from export data."""
-        success = clipboard_manager.import_snippets(request.model_dump())
+        # Hand over the already-validated fields rather than re-dumping the model
+        success = await run_in_threadpool(
+            clipboard_manager.import_snippets,
+            {"version": request.version, "snippets": request.snippets},
+        )
         if not success:
             raise HTTPException(status_code=400, detail="Import failed")
         return SuccessResponse(success=True, message="Import successful")
@@ -243,12 +332,8 @@ def create_router(clipboard_manager):
     @router.post("/api/search", response_model=SearchResponse)
     async def search_post(request: SearchRequest):
         """Search across history and snippets (POST)."""
-        results = clipboard_manager.search_all(request.query)
-        history = results["history"] if request.include_history else []
-        snippets = results["snippets"] if request.include_snippets else []
-        return SearchResponse(
-            history=[clipboard_item_to_response(item) for item in history],
-            snippets=[clipboard_item_to_response(item) for item in snippets],
+        return await search_results(
+            request.query, request.include_history, request.include_snippets
         )
 
     # Health endpoint for API route consistency
@@ -0,0 +1,75 @@
+"""
+ASGI middleware for SimpleCP REST API.
+
+Request tracking is implemented as plain ASGI rather than through
+@app.middleware("http"), which wraps every call in a Request object and an
+extra anyio task.
+"""
+
+import time
+
+from logger import logger
+from monitoring import track_api_request, capture_exception
+
+
+class RequestTrackingMiddleware:
+    """Track API request metrics and, optionally, expose timing headers."""
+
+    def __init__(self, app, expose_debug_info: bool = False):
+        """
+        Initialize RequestTrackingMiddleware.
+
+        Args:
+            app: Wrapped ASGI application
+            expose_debug_info: Add X-Process-Time and include request headers
+                in error context (development only)
+        """
+        self.app = app
+        self.expose_debug_info = expose_debug_info
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.expose_debug_info:
+                    duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"x-process-time", f"{duration_ms:.2f}ms".encode()),
+                    ]
+            await send(message)
+
+        method = scope["method"]
+        path = scope["path"]
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            logger.error(
+                f"Request failed: {method} {path}",
+                exc_info=True,
+                extra={"method": method, "path": path, "duration_ms": duration_ms},
+            )
+            request_context = {"method": method, "path": path}
+            if self.expose_debug_info:
+                request_context["headers"] = {
+                    key.decode("latin-1"): value.decode("latin-1")
+                    for key, value in scope["headers"]
+                }
+            capture_exception(e, context={"request": request_context})
+            raise
+
+        track_api_request(
+            method=method,
+            path=path,
+            status_code=status_code,
+            duration_ms=(time.perf_counter_ns() - start_ns) / 1e6,
+        )
@@ -5,7 +5,7 @@ Pydantic models for request/response validation.
 """
 
 from pydantic import BaseModel
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any, Dict, Iterable
 
 
 class ClipboardItemResponse(BaseModel):
@@ -46,6 +46,12 @@ class CreateSnippetRequest(BaseModel):
     tags: List[str] = []
 
 
+class BulkCreateSnippetsRequest(BaseModel):
+    """Request to create many snippets directly in one call."""
+
+    snippets: List[CreateSnippetRequest]
+
+
 class UpdateSnippetRequest(BaseModel):
     """Request to update snippet."""
 
@@ -163,3 +169,13 @@ def clipboard_item_to_response(item: Any) -> ClipboardItemResponse:
         folder_path=item.folder_path,
         tags=item.tags,
     )
+
+
+def clipboard_items_to_dicts(items: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Convert ClipboardItems to response dicts.
+
+    Produces the same shape as ClipboardItemResponse.model_dump() but reuses
+    each item's cached representation instead of validating a model per item.
+    """
+    return [item.to_response_dict() for item in items]
@@ -3,21 +3,25 @@ FastAPI server for SimpleCP REST API.
 
 Main server configuration and startup.
 """
-import time
+import asyncio
+from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 from clipboard_manager import ClipboardManager
+from api.cache import TTLValue
 from api.endpoints import create_router
+from api.middleware import RequestTrackingMiddleware
 from settings import settings
 from logger import logger
 from monitoring import (
     initialize_sentry,
-    track_api_request,
     capture_exception,
     get_monitoring_stats,
+    prewarm_api_metrics,
 )
 
 
@@ -34,56 +38,38 @@ def create_app(clipboard_manager: ClipboardManager = None) -> FastAPI:
     # Initialize Sentry for crash reporting
     initialize_sentry()
 
+    # Create clipboard manager if not provided
+    if clipboard_manager is None:
+        clipboard_manager = ClipboardManager()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Size the worker threadpool on startup; persist unsaved data on shutdown."""
+        # Blocking manager calls are offloaded to anyio's default threadpool
+        to_thread.current_default_thread_limiter().total_tokens = settings.thread_pool_size
+        logger.info(
+            f"SimpleCP API starting up (version: {settings.app_version}, "
+            f"environment: {settings.environment})"
+        )
+        yield
+        logger.info("SimpleCP API shutting down")
+        if clipboard_manager.history_store.modified or clipboard_manager.snippet_store.modified:
+            await asyncio.to_thread(clipboard_manager.save_stores)
+
     app = FastAPI(
         title="SimpleCP API",
         description="REST API for SimpleCP clipboard manager",
         version=settings.app_version,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
-    # Request tracking middleware
-    @app.middleware("http")
-    async def track_requests(request: Request, call_next):
-        """Track API requests and performance."""
-        start_time = time.time()
-
-        try:
-            response = await call_next(request)
-            duration_ms = (time.time() - start_time) * 1000
-
-            # Track request metrics
-            track_api_request(
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-                duration_ms=duration_ms,
-            )
-
-            # Add performance headers
-            response.headers["X-Process-Time"] = f"{duration_ms:.2f}ms"
-
-            return response
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(
-                f"Request failed: {request.method} {request.url.path}",
-                exc_info=True,
-                extra={
-                    "method": request.method,
-                    "path": str(request.url.path),
-                    "duration_ms": duration_ms,
-                },
-            )
-            capture_exception(
-                e,
-                context={
-                    "request": {
-                        "method": request.method,
-                        "path": str(request.url.path),
-                        "headers": dict(request.headers),
-                    }
-                },
-            )
-            raise
+    # Request tracking middleware (skipped entirely when disabled)
+    if settings.enable_request_tracking:
+        # Timing header and request headers in error context are dev-only
+        app.add_middleware(
+            RequestTrackingMiddleware, expose_debug_info=settings.is_development
+        )
 
     # Global exception handler
     @app.exception_handler(Exception)
@@ -106,7 +92,7 @@ def create_app(clipboard_manager: ClipboardManager = None) -> FastAPI:
                 }
             },
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Internal server error",
@@ -123,10 +109,6 @@ def create_app(clipboard_manager: ClipboardManager = None) -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Create clipboard manager if not provided
-    if clipboard_manager is None:
-        clipboard_manager = ClipboardManager()
-
     # Store manager in app state
     app.state.clipboard_manager = clipboard_manager
 
@@ -144,14 +126,18 @@ def create_app(clipboard_manager: ClipboardManager = None) -> FastAPI:
             "environment": settings.environment,
         }
 
+    # Health probes may poll rapidly; serve stats that are at most a few seconds old
+    health_stats = TTLValue(clipboard_manager.get_stats, settings.health_cache_ttl)
+    health_monitoring_stats = TTLValue(get_monitoring_stats, settings.health_cache_ttl)
+
     @app.get("/health")
     async def health():
         """Health check endpoint with detailed metrics."""
         if not settings.health_check_enabled:
             return {"status": "disabled"}
 
-        stats = clipboard_manager.get_stats()
-        monitoring_stats = get_monitoring_stats()
+        stats = health_stats.get()
+        monitoring_stats = health_monitoring_stats.get()
 
         return {
             "status": "healthy",
@@ -161,22 +147,45 @@ def create_app(clipboard_manager: ClipboardManager = None) -> FastAPI:
             "monitoring": monitoring_stats,
         }
 
-    @app.on_event("startup")
-    async def startup_event():
-        """Log startup event."""
-        logger.info(
-            f"SimpleCP API starting up (version: {settings.app_version}, "
-            f"environment: {settings.environment})"
-        )
-
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        """Log shutdown event."""
-        logger.info("SimpleCP API shutting down")
+    # Route set is final here; size the tracker for it before the first request
+    prewarm_api_metrics(app.routes)
 
     return app
 
 
+def _select_loop() -> str:
+    """Use uvloop when it is installed, falling back to plain asyncio."""
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return "asyncio"
+    return "uvloop"
+
+
+def _select_http() -> str:
+    """Use the httptools C parser when it is installed, falling back to h11."""
+    try:
+        import httptools  # noqa: F401
+    except ImportError:
+        return "h11"
+    return "httptools"
+
+
+def server_options() -> dict:
+    """uvicorn options shared by run_server and the daemon's embedded server."""
+    return {
+        "log_level": settings.log_level.lower(),
+        "access_log": False,
+        "loop": _select_loop(),
+        "http": _select_http(),
+        "ws": "none",
+        "proxy_headers": False,
+        "forwarded_allow_ips": None,
+        "server_header": False,
+        "date_header": False,
+    }
+
+
 def run_server(
     host: str = None,
     port: int = None,
@@ -190,6 +199,7 @@ def run_server(
         port: Server port (defaults to settings.api_port)
         clipboard_manager: ClipboardManager instance
     """
+    settings.ensure_directories()
     app = create_app(clipboard_manager)
 
     # Use settings if not specified
@@ -202,8 +212,8 @@ def run_server(
         app,
         host=host,
         port=port,
-        log_level=settings.log_level.lower(),
         reload=settings.api_reload,
+        **server_options(),
     )
 
 
@@ -1,71 +1,145 @@
 """ClipboardManager - Core backend service for clipboard management."""
-import pyperclip, json, os
+import orjson, pyperclip, os, sys, tempfile, threading
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from functools import wraps
+from itertools import islice
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Callable
 from stores.clipboard_item import ClipboardItem
 from stores.history_store import HistoryStore
 from stores.snippet_store import SnippetStore
 
 
+def _detect_change_counter() -> Optional[Callable[[], int]]:
+    """Return a cheap pasteboard change-count reader on macOS (pyobjc), else None."""
+    if sys.platform != "darwin":
+        return None
+    try:
+        from AppKit import NSPasteboard
+    except ImportError:
+        return None
+    return NSPasteboard.generalPasteboard().changeCount
+
+
+def _synchronized(method):
+    """Run method under the manager's lock (API threadpool and daemon threads share it)."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class ClipboardManager:
     """Core clipboard manager with multi-store architecture."""
 
     def __init__(self, data_dir: Optional[str] = None, max_history: int = 50, display_count: int = 10):
+        # Reentrant: mutators call save_stores while already holding it
+        self._lock = threading.RLock()
         self.history_store = HistoryStore(max_items=max_history, display_count=display_count)
         self.snippet_store = SnippetStore()
         self._current_clipboard = ""
+        # changeCount is monotonic, so an unchanged value means nothing was copied
+        self._change_counter = _detect_change_counter()
+        self._last_change_count: Optional[int] = None
         self.data_dir = data_dir or os.path.join(os.path.dirname(__file__), "data")
         os.makedirs(self.data_dir, exist_ok=True)
         self.history_file = os.path.join(self.data_dir, "history.json")
         self.snippets_file = os.path.join(self.data_dir, "snippets.json")
         self.auto_save_enabled = True
+        # Data version for response caching, bumped on every store mutation
+        self._version = 0
+        self.history_store.add_delegate(self._on_store_changed)
+        self.snippet_store.add_delegate(self._on_store_changed)
         self.load_stores()
 
-    def check_clipboard(self) -> Optional[ClipboardItem]:
-        """Check clipboard for changes and add to history if changed."""
+    @property
+    def version(self) -> int:
+        """Monotonic data version; changes whenever history or snippets change."""
+        return self._version
+
+    def _on_store_changed(self, event: str, *args):
+        """Store delegate that invalidates cached views of the data."""
+        self._version += 1
+
+    def clipboard_may_have_changed(self) -> bool:
+        """Cheap pre-check for pollers; False only when the clipboard is known unchanged."""
+        if self._change_counter is None:
+            return True
         try:
+            return self._change_counter() != self._last_change_count
+        except Exception:
+            return True
+
+    @_synchronized
+    def check_clipboard(self, save: bool = True) -> Optional[ClipboardItem]:
+        """Check clipboard for changes and add to history if changed.
+
+        Pollers that checkpoint on their own schedule pass save=False.
+        """
+        try:
+            if self._change_counter is not None:
+                change_count = self._change_counter()
+                if change_count == self._last_change_count:
+                    return None
+                self._last_change_count = change_count
             current = pyperclip.paste()
             if current != self._current_clipboard and current.strip():
                 self._current_clipboard = current
-                return self.add_clip(current)
+                return self.add_clip(current, save=save)
         except Exception as e:
             print(f"Error checking clipboard: {e}")
         return None
 
-    def add_clip(self, content: str, source_app: Optional[str] = None) -> ClipboardItem:
-        """Add clipboard item to history with automatic deduplication."""
+    @_synchronized
+    def add_clip(self, content: str, source_app: Optional[str] = None, save: bool = True) -> Optional[ClipboardItem]:
+        """Add clipboard item to history with automatic deduplication. Blank content is ignored."""
+        if not content or content.isspace():
+            return None
         clip = ClipboardItem(content=content, source_app=source_app)
         self.history_store.insert(clip)
-        if self.auto_save_enabled:
+        if save and self.auto_save_enabled:
             self.save_stores()
         return clip
 
+    @_synchronized
+    def add_clips_bulk(
+        self, contents: Iterable[str], source_app: Optional[str] = None, save: bool = True
+    ) -> List[ClipboardItem]:
+        """Add many clips with one dedup pass, one trim and at most one save."""
+        clips = [
+            ClipboardItem(content=content, source_app=source_app)
+            for content in contents
+            if content and not content.isspace()
+        ]
+        self.history_store.insert_many(clips)
+        if clips and save and self.auto_save_enabled:
+            self.save_stores()
+        return clips
+
+    @_synchronized
     def copy_to_clipboard(self, clip_id: str) -> bool:
         """Copy item to system clipboard by ID."""
-        for item in self.history_store.items:
-            if item.clip_id == clip_id:
-                pyperclip.copy(item.content)
-                self._current_clipboard = item.content
-                return True
-        item = self.snippet_store.get_snippet_by_id(clip_id)
+        item = self.history_store.get_item_by_id(clip_id) or self.snippet_store.get_snippet_by_id(clip_id)
         if item:
             pyperclip.copy(item.content)
             self._current_clipboard = item.content
             return True
         return False
 
+    @_synchronized
     def save_as_snippet(
         self, clip_id: str, name: str, folder: str, tags: Optional[List[str]] = None
     ) -> Optional[ClipboardItem]:
-        """Convert history item to snippet."""
-        for item in self.history_store.items:
-            if item.clip_id == clip_id:
-                snippet = item.make_snippet(name, folder, tags)
-                self.snippet_store.add_snippet(folder, snippet)
-                if self.auto_save_enabled:
-                    self.save_stores()
-                return snippet
-        return None
+        """Save a copy of a history item as a snippet."""
+        item = self.history_store.get_item_by_id(clip_id)
+        if item is None:
+            return None
+        # A copy, so later snippet edits can't change the history entry
+        snippet = ClipboardItem.from_dict(item.to_dict()).make_snippet(name, folder, tags)
+        self.snippet_store.add_snippet(folder, snippet)
+        if self.auto_save_enabled:
+            self.save_stores()
+        return snippet
 
     # History operations
     def get_recent_history(self) -> List[ClipboardItem]:
@@ -76,27 +150,32 @@ class ClipboardManager:
         """Get all history items."""
         return self.history_store.get_items(limit)
 
+    def iter_history(self, limit: Optional[int] = None) -> Iterator[ClipboardItem]:
+        """Iterate history items (newest first) without copying the store."""
+        return islice(self.history_store.items, limit)
+
     def get_history_folders(self) -> List[Dict[str, Any]]:
         """Get auto-generated history folder ranges."""
         return self.history_store.get_auto_folders()
 
+    @_synchronized
     def clear_history(self):
         """Clear all clipboard history."""
         self.history_store.clear()
         if self.auto_save_enabled:
             self.save_stores()
 
+    @_synchronized
     def delete_history_item(self, clip_id: str) -> bool:
         """Delete specific history item by ID."""
-        for i, item in enumerate(self.history_store.items):
-            if item.clip_id == clip_id:
-                self.history_store.delete_item(i)
-                if self.auto_save_enabled:
-                    self.save_stores()
-                return True
-        return False
+        if self.history_store.delete_item_by_id(clip_id) is None:
+            return False
+        if self.auto_save_enabled:
+            self.save_stores()
+        return True
 
     # Snippet operations
+    @_synchronized
     def create_snippet_folder(self, folder_name: str) -> bool:
         """Create new snippet folder."""
         result = self.snippet_store.create_folder(folder_name)
@@ -104,6 +183,7 @@ class ClipboardManager:
             self.save_stores()
         return result
 
+    @_synchronized
     def rename_snippet_folder(self, old_name: str, new_name: str) -> dict:
         """Rename snippet folder. Returns detailed result with success status and error info."""
         result = self.snippet_store.rename_folder(old_name, new_name)
@@ -116,6 +196,7 @@ class ClipboardManager:
         result = self.rename_snippet_folder(old_name, new_name)
         return result["success"]
 
+    @_synchronized
     def delete_snippet_folder(self, folder_name: str) -> bool:
         """Delete snippet folder."""
         result = self.snippet_store.delete_folder(folder_name)
@@ -135,6 +216,12 @@ class ClipboardManager:
         """Get all snippets organized by folder."""
         return self.snippet_store.get_all_snippets()
 
+    def iter_snippets(self) -> Iterator[ClipboardItem]:
+        """Iterate all snippets across folders without copying folder contents."""
+        for items in list(self.snippet_store.folders.values()):
+            yield from items
+
+    @_synchronized
     def add_snippet_direct(self, content: str, name: str, folder: str, tags: Optional[List[str]] = None) -> ClipboardItem:
         if not content or not content.strip():
             raise ValueError("Content cannot be empty")
@@ -144,22 +231,41 @@ class ClipboardManager:
         if self.auto_save_enabled: self.save_stores()
         return snippet
 
+    @_synchronized
+    def add_snippets_bulk(self, snippets: Iterable[Dict[str, Any]]) -> List[ClipboardItem]:
+        """Add many snippets (content/name/folder/tags dicts) with one save; all are validated first."""
+        entries = list(snippets)
+        if any(not entry.get("content") or not entry["content"].strip() for entry in entries):
+            raise ValueError("Content cannot be empty")
+        created = []
+        for entry in entries:
+            snippet = ClipboardItem(content=entry["content"])
+            snippet.make_snippet(entry["name"], entry["folder"], entry.get("tags"))
+            self.snippet_store.add_snippet(entry["folder"], snippet)
+            created.append(snippet)
+        if created and self.auto_save_enabled: self.save_stores()
+        return created
+
+    @_synchronized
     def update_snippet(self, folder_name: str, clip_id: str, new_content: Optional[str] = None, new_name: Optional[str] = None, new_tags: Optional[List[str]] = None) -> bool:
         result = self.snippet_store.update_snippet(folder_name, clip_id, new_content, new_name, new_tags)
         if result and self.auto_save_enabled: self.save_stores()
         return result
 
+    @_synchronized
     def delete_snippet(self, folder_name: str, clip_id: str) -> bool:
         result = self.snippet_store.delete_snippet(folder_name, clip_id)
         if result and self.auto_save_enabled: self.save_stores()
         return result
 
+    @_synchronized
     def move_snippet(self, from_folder: str, to_folder: str, clip_id: str) -> bool:
         result = self.snippet_store.move_snippet(from_folder, to_folder, clip_id)
         if result and self.auto_save_enabled: self.save_stores()
         return result
 
     # Search operations
+    @_synchronized
     def search_all(self, query: str) -> Dict[str, List[ClipboardItem]]:
         """Search across history and snippets."""
         return {
@@ -168,41 +274,64 @@ class ClipboardManager:
         }
 
     # Persistence operations
+    @staticmethod
+    def _write_json(path: str, data: Any):
+        """Write JSON via a unique temp file and os.replace so readers never see a partial file."""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @_synchronized
     def save_stores(self):
         """Save all stores to disk."""
         try:
             history_data = [item.to_dict() for item in self.history_store.items]
-            with open(self.history_file, "w") as f:
-                json.dump(history_data, f, indent=2)
+            self._write_json(self.history_file, history_data)
             snippet_data = {
                 folder: [item.to_dict() for item in items]
                 for folder, items in self.snippet_store.folders.items()
             }
-            with open(self.snippets_file, "w") as f:
-                json.dump(snippet_data, f, indent=2)
+            self._write_json(self.snippets_file, snippet_data)
             self.history_store.modified = False
             self.snippet_store.modified = False
         except Exception as e:
             print(f"Error saving stores: {e}")
 
+    @_synchronized
     def load_stores(self):
         """Load all stores from disk."""
         try:
             if os.path.exists(self.history_file):
-                with open(self.history_file, "r") as f:
-                    data = json.load(f)
+                with open(self.history_file, "rb") as f:
+                    data = orjson.loads(f.read())
                 self.history_store.items = [
                     ClipboardItem.from_dict(item_data) for item_data in data
                 ]
             if os.path.exists(self.snippets_file):
-                with open(self.snippets_file, "r") as f:
-                    data = json.load(f)
+                with open(self.snippets_file, "rb") as f:
+                    data = orjson.loads(f.read())
                 for folder_name, items_data in data.items():
                     self.snippet_store.folders[folder_name] = [
                         ClipboardItem.from_dict(item_data) for item_data in items_data
                     ]
         except Exception as e:
             print(f"Error loading stores: {e}")
+        self._version += 1
+
+    @_synchronized
+    def replace_state(
+        self, items: List[ClipboardItem], folders: Dict[str, List[ClipboardItem]]
+    ):
+        """Swap in history items and snippet folders wholesale, without firing store delegates."""
+        self.history_store.items = items
+        self.snippet_store.folders = folders
+        # Cached API responses are keyed on the data version
+        self._version += 1
 
     def get_stats(self) -> Dict[str, Any]:
         """Get manager statistics."""
@@ -221,19 +350,21 @@ class ClipboardManager:
             "snippet_count": len(self.snippet_store),
         }
 
-    def export_snippets(self) -> Dict[str, Any]:
-        """Export all snippets."""
-        all_snippets = []
-        for folder, items in self.snippet_store.folders.items():
-            for item in items:
-                all_snippets.append(item.to_dict())
+    def export_envelope(self) -> Dict[str, Any]:
+        """Get export metadata without the snippets themselves."""
         return {
             "version": "1.0",
             "export_date": datetime.now().isoformat(),
-            "snippets": all_snippets,
             "metadata": {"folder_count": len(self.snippet_store.folders)},
         }
 
+    def export_snippets(self) -> Dict[str, Any]:
+        """Export all snippets."""
+        export_data = self.export_envelope()
+        export_data["snippets"] = [item.to_dict() for item in self.iter_snippets()]
+        return export_data
+
+    @_synchronized
     def import_snippets(self, import_data: Dict[str, Any]) -> bool:
         """Import snippets from export data."""
         try:
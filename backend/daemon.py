@@ -4,17 +4,31 @@ Background daemon for SimpleCP.
 Runs clipboard monitoring and REST API server together.
 """
 
-import threading
-import time
+import asyncio
+import contextlib
 import signal
-import sys
+
+import uvicorn
 
 from clipboard_manager import ClipboardManager
-from api.server import run_server
+from api.server import create_app, server_options
 from settings import settings
 from logger import logger
 from monitoring import capture_exception, track_clipboard_event
 
+STARTUP_BANNER = """
+╔══════════════════════════════════════════╗
+║     SimpleCP Daemon Started              ║
+╟──────────────────────────────────────────╢
+║  Version: {version}                        ║
+║  Environment: {environment}               ║
+║  📋 Clipboard Monitor: Running           ║
+║  🌐 API Server: http://{host}:{port}  ║
+║  📊 History: {history_count} items                   ║
+║  📁 Snippets: {snippet_count} snippets              ║
+╚══════════════════════════════════════════╝
+"""
+
 
 class SimpleCP_Daemon:
     """Background daemon managing clipboard monitoring and API server."""
@@ -37,18 +51,28 @@ class SimpleCP_Daemon:
         self.host = host or settings.api_host
         self.port = port or settings.api_port
         self.check_interval = check_interval or settings.clipboard_check_interval
+        # Polled clips are saved in batches rather than one file rewrite per copy
+        self.checkpoint_every = settings.clipboard_checkpoint_every
+        self._unsaved_clips = 0
         self.running = False
-        self.clipboard_thread = None
-        self.api_thread = None
+        self.server = None
+        self.monitor_task = None
+        self._stop_event = None
 
-    def clipboard_monitor_loop(self):
-        """Background clipboard monitoring loop."""
+    async def clipboard_monitor_loop(self):
+        """Clipboard monitoring task running on the daemon's event loop."""
         logger.info(
             f"Clipboard monitoring started (checking every {self.check_interval}s)"
         )
         while self.running:
             try:
-                new_item = self.clipboard_manager.check_clipboard()
+                # Skip the threadpool hop entirely while the pasteboard is unchanged
+                new_item = None
+                if self.clipboard_manager.clipboard_may_have_changed():
+                    # pyperclip shells out on some platforms, so keep it off the loop
+                    new_item = await asyncio.to_thread(
+                        self.clipboard_manager.check_clipboard, False
+                    )
                 if new_item:
                     logger.info(f"New clipboard item: {new_item.display_string}")
                     track_clipboard_event(
@@ -56,20 +80,92 @@ class SimpleCP_Daemon:
                         item_id=new_item.clip_id,
                         content_type=new_item.content_type,
                     )
+                    self._unsaved_clips += 1
+                    if self._unsaved_clips >= self.checkpoint_every:
+                        await asyncio.to_thread(self.clipboard_manager.save_stores)
+                        self._unsaved_clips = 0
             except Exception as e:
                 logger.error(f"Error in clipboard monitor: {e}", exc_info=True)
                 capture_exception(e, context={"component": "clipboard_monitor"})
 
-            time.sleep(self.check_interval)
+            # Wait out the interval, but wake immediately when stop() is called
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self.check_interval)
+
+    def stop(self):
+        """Request a graceful stop; data is saved once the server has shut down."""
+        self.running = False
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self.server is not None:
+            self.server.should_exit = True
+
+    async def shutdown(self):
+        """Stop the monitor task and persist any unsaved changes without blocking the loop."""
+        logger.info("Stopping SimpleCP daemon...")
+        self.running = False
+        if self.monitor_task is not None:
+            self.monitor_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.monitor_task
+
+        manager = self.clipboard_manager
+        if not (manager.history_store.modified or manager.snippet_store.modified):
+            logger.info("No unsaved changes")
+            return
+
+        logger.info("Saving data...")
+        try:
+            await asyncio.to_thread(manager.save_stores)
+            self._unsaved_clips = 0
+            logger.info("Data saved successfully")
+        except Exception as e:
+            logger.error(f"Error saving data: {e}", exc_info=True)
+            capture_exception(e, context={"component": "shutdown"})
+
+    async def run(self):
+        """Run API server and clipboard monitor together on one event loop."""
+        # Created here so it binds to the running loop (required on Python 3.9)
+        self._stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except NotImplementedError:
+                pass  # Not supported on Windows; uvicorn still traps signals while serving
 
-    def start_api_server(self):
-        """Start API server in thread."""
         logger.info(f"Starting API server on {self.host}:{self.port}")
+        config = uvicorn.Config(
+            create_app(self.clipboard_manager),
+            host=self.host,
+            port=self.port,
+            **server_options(),
+        )
+        self.server = uvicorn.Server(config)
+        self.monitor_task = asyncio.create_task(self.clipboard_monitor_loop())
+
+        # Display startup message
+        print(
+            STARTUP_BANNER.format_map(
+                {
+                    "version": settings.app_version,
+                    "environment": settings.environment,
+                    "host": self.host,
+                    "port": self.port,
+                    "history_count": len(self.clipboard_manager.history_store),
+                    "snippet_count": len(self.clipboard_manager.snippet_store),
+                }
+            )
+        )
+        logger.info("SimpleCP daemon started successfully")
+
         try:
-            run_server(self.host, self.port, self.clipboard_manager)
+            await self.server.serve()
         except Exception as e:
             logger.error(f"Error in API server: {e}", exc_info=True)
             capture_exception(e, context={"component": "api_server"})
+        finally:
+            await self.shutdown()
 
     def start(self):
         """Start daemon - both clipboard monitor and API server."""
@@ -78,67 +174,21 @@ class SimpleCP_Daemon:
             return
 
         self.running = True
+        settings.ensure_directories()
 
         logger.info(f"Starting SimpleCP daemon (version: {settings.app_version})")
 
-        # Start clipboard monitoring thread
-        self.clipboard_thread = threading.Thread(
-            target=self.clipboard_monitor_loop, daemon=True
-        )
-        self.clipboard_thread.start()
-
-        # Start API server thread
-        self.api_thread = threading.Thread(target=self.start_api_server, daemon=True)
-        self.api_thread.start()
-
-        # Display startup message
-        startup_msg = f"""
-╔══════════════════════════════════════════╗
-║     SimpleCP Daemon Started              ║
-╟──────────────────────────────────────────╢
-║  Version: {settings.app_version}                        ║
-║  Environment: {settings.environment}               ║
-║  📋 Clipboard Monitor: Running           ║
-║  🌐 API Server: http://{self.host}:{self.port}  ║
-║  📊 History: {len(self.clipboard_manager.history_store)} items                   ║
-║  📁 Snippets: {len(self.clipboard_manager.snippet_store)} snippets              ║
-╚══════════════════════════════════════════╝
-"""
-        print(startup_msg)
-        logger.info("SimpleCP daemon started successfully")
-
-        # Keep main thread alive
-        try:
-            while self.running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            self.stop()
-
-    def stop(self):
-        """Stop daemon gracefully."""
-        logger.info("Stopping SimpleCP daemon...")
-        self.running = False
-
-        # Wait for threads to finish
-        if self.clipboard_thread and self.clipboard_thread.is_alive():
-            self.clipboard_thread.join(timeout=2)
-
-        logger.info("Saving data...")
         try:
-            self.clipboard_manager.save_stores()
-            logger.info("Data saved successfully")
-        except Exception as e:
-            logger.error(f"Error saving data: {e}", exc_info=True)
-            capture_exception(e, context={"component": "shutdown"})
+            if server_options()["loop"] == "uvloop":
+                import uvloop
 
+                # The policy works on every uvloop; uvloop.run() needs >= 0.18
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            asyncio.run(self.run())
+        except KeyboardInterrupt:
+            # Only reachable where loop signal handlers are unsupported
+            pass
         logger.info("SimpleCP daemon stopped")
-        sys.exit(0)
-
-
-def signal_handler(sig, frame):
-    """Handle termination signals."""
-    logger.info("Received termination signal, shutting down...")
-    sys.exit(0)
 
 
 def main():
@@ -164,10 +214,6 @@ def main():
 
     args = parser.parse_args()
 
-    # Register signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-
     # Create and start daemon
     daemon = SimpleCP_Daemon(
         host=args.host, port=args.port, check_interval=args.interval
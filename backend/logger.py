@@ -7,12 +7,15 @@ Provides consistent logging across the application with support for:
 - Different log levels
 - Contextual information
 """
+import atexit
+import copy
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
+import orjson
 from pythonjsonlogger import jsonlogger
 
 from settings import settings
@@ -25,17 +28,80 @@ class ContextFilter(logging.Filter):
         super().__init__()
         self.app_name = app_name
         self.version = version
+        self._context = {"app_name": app_name, "app_version": version}
 
     def filter(self, record):
-        record.app_name = self.app_name
-        record.app_version = self.version
+        # One C-level dict update instead of an attribute store per field
+        record.__dict__.update(self._context)
         return True
 
 
+class OrjsonFormatter(jsonlogger.JsonFormatter):
+    """JsonFormatter that serializes records with orjson instead of json.dumps."""
+
+    _fallback = jsonlogger.JsonEncoder().default
+
+    def jsonify_log_record(self, log_record):
+        # python-json-logger's encoder still covers what orjson can't serialize
+        return orjson.dumps(
+            log_record,
+            default=self.json_default or self._fallback,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+
+class RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps the exception separate from the message.
+
+    The stock prepare() formats the record and folds the traceback into
+    msg, so JSON output loses its exc_info field. This one only resolves
+    the message arguments and the traceback text, and leaves the record
+    otherwise intact for the listener-side formatter.
+    """
+
+    _exc_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self._exc_formatter.formatException(record.exc_info)
+        return record
+
+
+# Resolved once; formatters are stateless and shared by every configured logger
+_LOG_LEVEL = getattr(logging, settings.log_level.upper())
+
+if settings.log_json_format:
+    # JSON format for production
+    _CONSOLE_FORMATTER = _FILE_FORMATTER = OrjsonFormatter(
+        "%(timestamp)s %(level)s %(name)s %(message)s %(pathname)s %(lineno)d",
+        rename_fields={
+            "levelname": "level",
+            "asctime": "timestamp",
+        },
+    )
+else:
+    # Human-readable format for development
+    _CONSOLE_FORMATTER = logging.Formatter(
+        "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    _FILE_FORMATTER = logging.Formatter(
+        "%(asctime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
 def setup_logging(name: Optional[str] = None) -> logging.Logger:
     """
     Set up logging with file rotation and optional JSON formatting.
 
+    Callers only enqueue records; formatting and the console/file writes
+    happen on a QueueListener thread.
+
     Args:
         name: Logger name (defaults to 'simplecp')
 
@@ -49,36 +115,18 @@ def setup_logging(name: Optional[str] = None) -> logging.Logger:
     if logger.handlers:
         return logger
 
-    logger.setLevel(getattr(logging, settings.log_level.upper()))
+    logger.setLevel(_LOG_LEVEL)
 
     # Console handler (always enabled)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
 
-    if settings.log_json_format:
-        # JSON format for production
-        json_formatter = jsonlogger.JsonFormatter(
-            "%(timestamp)s %(level)s %(name)s %(message)s %(pathname)s %(lineno)d",
-            rename_fields={
-                "levelname": "level",
-                "asctime": "timestamp",
-            },
-        )
-        console_handler.setFormatter(json_formatter)
-    else:
-        # Human-readable format for development
-        console_formatter = logging.Formatter(
-            "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        console_handler.setFormatter(console_formatter)
-
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler with rotation (if enabled)
     if settings.log_to_file:
-        log_path = Path(settings.log_file_path)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path = settings.log_path
 
         file_handler = RotatingFileHandler(
             filename=str(log_path),
@@ -87,17 +135,16 @@ def setup_logging(name: Optional[str] = None) -> logging.Logger:
             encoding="utf-8",
         )
         file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(_FILE_FORMATTER)
 
-        if settings.log_json_format:
-            file_handler.setFormatter(json_formatter)
-        else:
-            file_formatter = logging.Formatter(
-                "%(asctime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-            file_handler.setFormatter(file_formatter)
+        handlers.append(file_handler)
 
-        logger.addHandler(file_handler)
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Drains any queued records before the interpreter exits
+    atexit.register(listener.stop)
+    logger.addHandler(RecordQueueHandler(log_queue))
 
     # Add context filter
     context_filter = ContextFilter(settings.app_name, settings.app_version)
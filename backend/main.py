@@ -17,59 +17,52 @@ project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
 from api.server import run_server  # noqa: E402
+from utils.process import find_pids_on_port, listening_ports, wait_for_exit  # noqa: E402
 
 # PID file location
 PID_FILE = "/tmp/simplecp_backend.pid"
 
+# Open, flock'd descriptor for PID_FILE while this process owns it
+_pid_fd = None
+
 
 def is_port_in_use(port):
     """Check if a port is already in use."""
+    listen_ports = listening_ports()
+    if listen_ports is not None:
+        return port in listen_ports
+
+    # No /proc (macOS): a refused connect means nothing is listening
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        try:
-            s.bind(("127.0.0.1", port))
-            return False
-        except OSError:
-            return True
+        s.settimeout(0.05)
+        return s.connect_ex(("127.0.0.1", port)) == 0
 
 
 def kill_existing_process(port):
     """Try to kill any existing process using the port."""
     try:
-        import subprocess
-        import time
-        result = subprocess.run(
-            ["lsof", "-t", f"-i:{port}"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            pids = result.stdout.strip().split('\n')
+        pids = find_pids_on_port(port)
+        if pids:
             for pid in pids:
                 try:
-                    pid_int = int(pid)
                     print(f"🛑 Killing existing process {pid} on port {port}")
                     # Try SIGTERM first
-                    os.kill(pid_int, signal.SIGTERM)
-                except (ProcessLookupError, ValueError):
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
                     pass
-            time.sleep(0.5)
 
-            # If port still in use, force kill with SIGKILL
-            if is_port_in_use(port):
+            # Probe the PIDs we signalled rather than looking the port up again
+            alive = wait_for_exit(pids, timeout=0.5)
+
+            # Force kill whatever ignored SIGTERM
+            if alive:
                 print(f"⚠️ Process didn't respond to SIGTERM, using SIGKILL...")
-                result = subprocess.run(
-                    ["lsof", "-t", f"-i:{port}"],
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    pids = result.stdout.strip().split('\n')
-                    for pid in pids:
-                        try:
-                            os.kill(int(pid), signal.SIGKILL)
-                        except (ProcessLookupError, ValueError):
-                            pass
-                    time.sleep(0.3)
+                for pid in alive:
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                wait_for_exit(alive, timeout=0.3)
 
             return not is_port_in_use(port)
     except Exception as e:
@@ -78,23 +71,53 @@ def kill_existing_process(port):
 
 
 def write_pid_file():
-    """Write current process PID to file."""
+    """
+    Write current process PID to file, holding an exclusive lock on it while we run.
+
+    Returns False if another SimpleCP process already holds the lock.
+    """
+    global _pid_fd
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None  # No flock outside POSIX; write the file unlocked
     try:
-        with open(PID_FILE, 'w') as f:
-            f.write(str(os.getpid()))
+        # O_CLOEXEC keeps the descriptor (and its lock) out of spawned children like lsof
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+        fd = os.open(PID_FILE, flags, 0o644)
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                print(f"❌ PID file is locked by another SimpleCP process: {PID_FILE}")
+                return False
+        # Truncate only once the lock is ours, then write the PID in one call
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+        _pid_fd = fd
         print(f"📝 PID file written: {PID_FILE}")
     except Exception as e:
         print(f"⚠️ Failed to write PID file: {e}")
+    return True
 
 
 def remove_pid_file():
     """Remove PID file on exit."""
+    global _pid_fd
+    if _pid_fd is None:
+        # Never locked it, so it isn't ours to remove
+        return
     try:
-        if os.path.exists(PID_FILE):
-            os.remove(PID_FILE)
-            print(f"🗑️ PID file removed: {PID_FILE}")
+        os.remove(PID_FILE)
+        print(f"🗑️ PID file removed: {PID_FILE}")
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"⚠️ Failed to remove PID file: {e}")
+    finally:
+        os.close(_pid_fd)
+        _pid_fd = None
 
 
 def signal_handler(signum, frame):
@@ -125,8 +148,9 @@ def main():
                 return 1
             print(f"✅ Port {port} freed successfully")
 
-        # Write PID file
-        write_pid_file()
+        # Write PID file; a held lock means another instance is running
+        if not write_pid_file():
+            return 1
 
         print("🚀 Starting SimpleCP API Server...")
         print(f"📋 Server running on http://localhost:{port}")
@@ -0,0 +1,646 @@
+"""
+Monitoring and analytics for SimpleCP.
+
+Provides crash reporting, performance monitoring, and usage analytics.
+"""
+import atexit
+import itertools
+import logging
+import math
+import queue
+import sys
+import threading
+import time
+from array import array
+from contextlib import ExitStack, contextmanager, nullcontext
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
+from functools import wraps
+from typing import Any, Callable, Iterable, List, Optional
+import sentry_sdk
+from sentry_sdk.integrations.fastapi import FastApiIntegration
+from sentry_sdk.integrations.logging import LoggingIntegration
+
+from settings import register_reload_hook, settings
+from logger import logger
+
+# Feature flags are snapshotted so the instrumented hot paths test a module
+# global instead of a Settings attribute; _refresh_flags() re-reads them
+_SENTRY_ENABLED = settings.enable_sentry
+_USAGE_ENABLED = settings.enable_usage_analytics
+_PERF_ENABLED = settings.enable_performance_tracking
+_SENTRY_SLOW_OP_MS = settings.sentry_slow_op_ms
+
+# Bound once; track_performance reads the clock twice per instrumented call
+_perf_counter_ns = time.perf_counter_ns
+
+
+# Log-spaced latency buckets, 1ms .. 32768ms+
+HIST_BUCKETS = 16
+_log2 = math.log2
+
+
+def _latency_bucket(duration_ms: float) -> int:
+    """Log2 bucket for a duration: 0 is under 2ms, i covers [2**i, 2**(i + 1)) ms."""
+    return 0 if duration_ms <= 1 else min(HIST_BUCKETS - 1, int(_log2(duration_ms)))
+
+
+class PerformanceTracker:
+    """Track performance metrics for operations."""
+
+    LOCK_STRIPES = 16
+
+    def __init__(self):
+        # Operation names are a small bounded set (API method + path), so each is
+        # interned to an index into flat parallel columns; averages are derived on read
+        self._ids: dict = {}
+        self._count = array("Q")
+        self._total_ms = array("d")
+        self._min_ms = array("d")
+        self._max_ms = array("d")
+        # HIST_BUCKETS counters per operation, row op_id at op_id * HIST_BUCKETS
+        self._hist = array("Q")
+        # Striped by operation id so unrelated operations don't serialize on one lock;
+        # the read-modify-write below is not atomic without the GIL
+        self._locks = tuple(threading.Lock() for _ in range(self.LOCK_STRIPES))
+        # Each write takes a fresh number from the counter, so any write after a
+        # snapshot leaves _version different from _snapshot_version
+        self._versions = itertools.count(1)
+        self._version = 0
+        self._snapshot_version = -1
+        self._snapshot: dict = {}
+
+    @contextmanager
+    def _all_locks(self):
+        """Hold every stripe; used when the columns themselves change size."""
+        with ExitStack() as stack:
+            for lock in self._locks:
+                stack.enter_context(lock)
+            yield
+
+    def _intern(self, operation: str) -> int:
+        with self._all_locks():
+            op_id = self._ids.get(operation)
+            if op_id is None:
+                op_id = len(self._count)
+                self._count.append(0)
+                self._total_ms.append(0.0)
+                self._min_ms.append(float("inf"))
+                self._max_ms.append(0.0)
+                self._hist.extend(bytes(HIST_BUCKETS))
+                self._ids[operation] = op_id
+            return op_id
+
+    def prewarm(self, operations: Iterable[str]):
+        """Intern known operation names up front so the hot path never grows the columns."""
+        for operation in operations:
+            if operation not in self._ids:
+                self._intern(operation)
+
+    def record(self, operation: str, duration_ms: float, **kwargs):
+        """Record a performance metric (duration in milliseconds)."""
+        op_id = self._ids.get(operation)
+        if op_id is None:
+            op_id = self._intern(operation)
+
+        with self._locks[op_id % self.LOCK_STRIPES]:
+            self._count[op_id] += 1
+            self._total_ms[op_id] += duration_ms
+            if duration_ms < self._min_ms[op_id]:
+                self._min_ms[op_id] = duration_ms
+            if duration_ms > self._max_ms[op_id]:
+                self._max_ms[op_id] = duration_ms
+            self._hist[op_id * HIST_BUCKETS + _latency_bucket(duration_ms)] += 1
+            self._version = next(self._versions)
+
+        # Skip building the message and extra dict when nothing would emit them
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Performance: %s took %.2fms",
+                operation,
+                duration_ms,
+                extra={"operation": operation, "duration_ms": duration_ms, **kwargs},
+            )
+
+    def get_stats(self) -> dict:
+        """
+        Get all performance statistics.
+
+        The result is shared between callers until the next record(); treat
+        it as read-only.
+        """
+        version = self._version
+        if version == self._snapshot_version:
+            return self._snapshot
+
+        stats = {}
+        for operation, op_id in list(self._ids.items()):
+            # Copy under the stripe lock so each entry is internally consistent
+            with self._locks[op_id % self.LOCK_STRIPES]:
+                count = self._count[op_id]
+                total_ms = self._total_ms[op_id]
+                min_ms = self._min_ms[op_id]
+                max_ms = self._max_ms[op_id]
+                row = op_id * HIST_BUCKETS
+                histogram = self._hist[row : row + HIST_BUCKETS].tolist()
+            if not count:
+                continue
+            stats[operation] = {
+                "count": count,
+                "total_ms": total_ms,
+                "min_ms": min_ms,
+                "max_ms": max_ms,
+                "avg_ms": total_ms / count,
+                "p50_ms": _histogram_percentile(histogram, count, max_ms, 50),
+                "p99_ms": _histogram_percentile(histogram, count, max_ms, 99),
+                "histogram": histogram,
+            }
+        self._snapshot = stats
+        self._snapshot_version = version
+        return stats
+
+    def percentile(self, operation: str, p: float) -> Optional[float]:
+        """
+        Estimate the p-th percentile duration of an operation from its histogram.
+
+        Args:
+            operation: Operation name
+            p: Percentile, 0-100
+
+        Returns:
+            Upper edge of the bucket holding the percentile (capped at the
+            observed max), or None if the operation has no samples
+        """
+        op_id = self._ids.get(operation)
+        if op_id is None:
+            return None
+        with self._locks[op_id % self.LOCK_STRIPES]:
+            count = self._count[op_id]
+            max_ms = self._max_ms[op_id]
+            row = op_id * HIST_BUCKETS
+            histogram = self._hist[row : row + HIST_BUCKETS].tolist()
+        if not count:
+            return None
+        return _histogram_percentile(histogram, count, max_ms, p)
+
+    def reset(self):
+        """Reset all metrics."""
+        # Interned ids stay valid so concurrent record() calls never index past the end
+        with self._all_locks():
+            for op_id in range(len(self._count)):
+                self._count[op_id] = 0
+                self._total_ms[op_id] = 0.0
+                self._min_ms[op_id] = float("inf")
+                self._max_ms[op_id] = 0.0
+            for i in range(len(self._hist)):
+                self._hist[i] = 0
+            self._version = next(self._versions)
+
+
+def _histogram_percentile(histogram: List[int], count: int, max_ms: float, p: float) -> float:
+    """Walk cumulative bucket counts to the bucket holding the p-th percentile."""
+    target = count * p / 100
+    seen = 0
+    for bucket, bucket_count in enumerate(histogram):
+        seen += bucket_count
+        if seen >= target:
+            return min(float(2 ** (bucket + 1)), max_ms)
+    return max_ms
+
+
+class UsageEvent(IntEnum):
+    """Counter slots for usage analytics events."""
+
+    CLIPBOARD_EVENTS = 0
+    API_REQUESTS = 1
+    HISTORY_OPERATIONS = 2
+    SNIPPET_OPERATIONS = 3
+    SEARCH_QUERIES = 4
+    ERRORS = 5
+
+
+# Public event names ("api_requests", ...) -> counter slot
+_USAGE_EVENT_INDEX = {event.name.lower(): event for event in UsageEvent}
+
+
+class UsageAnalytics:
+    """Track usage analytics for clipboard and API operations."""
+
+    def __init__(self):
+        # One flat C array of counters indexed by UsageEvent; the dict view is
+        # only built when stats are read
+        self._counters = array("Q", [0] * len(UsageEvent))
+        self._lock = threading.Lock()
+
+    def increment(self, event_type: str):
+        """Count a usage event without logging it."""
+        index = _USAGE_EVENT_INDEX.get(event_type)
+        if index is not None:
+            with self._lock:
+                self._counters[index] += 1
+
+    def track_event(self, event_type: str, **kwargs):
+        """Track a usage event."""
+        self.increment(event_type)
+
+        # Skip building the message and extra dict when nothing would emit them
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Usage Event: %s",
+                event_type,
+                extra={"event_type": "usage", "usage_event_type": event_type, **kwargs},
+            )
+
+    def get_stats(self) -> dict:
+        """Get all usage statistics."""
+        with self._lock:
+            counts = self._counters.tolist()
+        return {name: counts[index] for name, index in _USAGE_EVENT_INDEX.items()}
+
+    def reset(self):
+        """Reset all events."""
+        with self._lock:
+            for index in range(len(self._counters)):
+                self._counters[index] = 0
+
+
+class SentryDispatcher:
+    """Report slow operations to Sentry as transactions from a background thread.
+
+    Callers only enqueue; the worker coalesces whatever arrives within
+    flush_interval (or up to max_batch items) into one transaction per
+    operation. The queue is bounded: when Sentry can't keep up, new events
+    are dropped and counted rather than stalling the caller.
+
+    Errors, messages and breadcrumbs don't come through here: they must be
+    recorded on the calling thread to keep its request scope, and the SDK
+    already sends events from its own transport worker.
+    """
+
+    def __init__(
+        self, flush_interval: float = 0.1, max_batch: int = 512, capacity: int = 4096
+    ):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue = queue.Queue(maxsize=capacity)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.writes_total = 0
+        self.drops_total = 0
+
+    def submit(self, kind: str, *payload):
+        """Queue an event for the worker thread; drops it if the queue is full."""
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait((kind, payload))
+        except queue.Full:
+            with self._stats_lock:
+                self.drops_total += 1
+            return
+        with self._stats_lock:
+            self.writes_total += 1
+
+    def get_stats(self) -> dict:
+        """Get queue throughput and back-pressure counters."""
+        with self._stats_lock:
+            return {
+                "writes_total": self.writes_total,
+                "drops_total": self.drops_total,
+                "pending": self._queue.qsize(),
+            }
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sentry-dispatcher", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._dispatch(batch)
+
+    def flush(self):
+        """Send everything still queued from the calling thread."""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list):
+        slow_ops = {}
+        for kind, payload in batch:
+            if kind == "slow_op":
+                operation, duration_ms = payload
+                count, worst_ms = slow_ops.get(operation, (0, 0.0))
+                slow_ops[operation] = (count + 1, max(worst_ms, duration_ms))
+
+        # One transaction per slow operation per batch rather than one per call
+        for operation, (count, worst_ms) in slow_ops.items():
+            try:
+                with sentry_sdk.start_transaction(op=operation, name=operation) as transaction:
+                    transaction.set_measurement("duration_ms", worst_ms)
+                    transaction.set_data("count", count)
+            except Exception as e:
+                logger.error(f"Failed to forward slow_op to Sentry: {e}")
+
+
+# Global instances
+performance_tracker = PerformanceTracker()
+usage_analytics = UsageAnalytics()
+sentry_dispatcher = SentryDispatcher()
+
+
+def initialize_sentry():
+    """Initialize Sentry SDK for crash reporting and performance monitoring."""
+    sentry_config = settings.sentry_config
+
+    if not sentry_config:
+        logger.info("Sentry is disabled (no DSN configured)")
+        return
+
+    try:
+        # Configure logging integration
+        logging_integration = LoggingIntegration(
+            level=logging.INFO,  # Capture info and above as breadcrumbs
+            event_level=logging.ERROR,  # Send errors as events
+        )
+
+        # Initialize Sentry
+        sentry_sdk.init(
+            integrations=[
+                FastApiIntegration(transaction_style="endpoint"),
+                logging_integration,
+            ],
+            **sentry_config,
+            # Additional configuration
+            before_send=make_before_send(
+                settings.app_version,
+                settings.environment,
+                drop_events=settings.is_development and not _SENTRY_ENABLED,
+            ),
+            before_breadcrumb=before_breadcrumb,
+        )
+
+        logger.info(
+            f"Sentry initialized successfully (environment: {settings.sentry_environment})"
+        )
+    except Exception as e:
+        logger.error(f"Failed to initialize Sentry: {e}", exc_info=True)
+
+
+def make_before_send(app_version: str, environment: str, drop_events: bool = False):
+    """
+    Build the before_send hook with its settings bound at init time.
+
+    The hook lets us:
+    - Filter out sensitive data
+    - Add custom context
+    - Skip certain events
+    """
+    if drop_events:
+        # Development without Sentry explicitly enabled: send nothing
+        def before_send_event(event, hint):
+            return None
+
+        return before_send_event
+
+    def before_send_event(event, hint):
+        # Add custom tags
+        tags = event.get("tags")
+        if tags is None:
+            event["tags"] = {"app_version": app_version, "environment": environment}
+        else:
+            tags["app_version"] = app_version
+            tags["environment"] = environment
+        return event
+
+    return before_send_event
+
+
+def before_breadcrumb(crumb, hint):
+    """Filter and modify breadcrumbs before adding to Sentry."""
+    # Filter out sensitive breadcrumbs if needed
+    return crumb
+
+
+def _finish_operation(operation: str, start_ns: int, error: Optional[Exception], kwargs: dict):
+    """Record a timed operation and forward failures/slow calls to Sentry."""
+    duration_ms = (_perf_counter_ns() - start_ns) * 1e-6
+
+    if _PERF_ENABLED:
+        performance_tracker.record(operation, duration_ms, **kwargs)
+
+    # Only failures and slow operations are worth a Sentry round-trip
+    if _SENTRY_ENABLED:
+        if error is not None:
+            sentry_sdk.capture_exception(error)
+        elif duration_ms > _SENTRY_SLOW_OP_MS:
+            parent = sentry_sdk.get_current_span()
+            if parent is None:
+                sentry_dispatcher.submit("slow_op", operation, duration_ms)
+            else:
+                # Inside a request transaction: attach as a child span so the whole
+                # request still goes out as one envelope
+                end = datetime.now(timezone.utc)
+                span = parent.start_child(
+                    op=operation,
+                    description=operation,
+                    start_timestamp=end - timedelta(milliseconds=duration_ms),
+                )
+                span.finish(end_timestamp=end)
+
+
+@contextmanager
+def _track_performance(operation: str, **kwargs):
+    """Context manager to track operation performance."""
+    start_ns = _perf_counter_ns()
+    error = None
+
+    try:
+        yield
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        _finish_operation(operation, start_ns, error, kwargs)
+
+
+# Shared, stateless stand-in handed out when nothing would consume the timing
+_NOOP_CONTEXT = nullcontext()
+
+
+def track_performance(operation: str, **kwargs):
+    """
+    Context manager to track operation performance.
+
+    The flags are read per call rather than by rebinding this name, so
+    modules that imported it keep following reload_settings().
+    """
+    if _PERF_ENABLED or _SENTRY_ENABLED:
+        return _track_performance(operation, **kwargs)
+    return _NOOP_CONTEXT
+
+
+def _refresh_flags(new_settings=None):
+    """Re-snapshot feature flags, e.g. after settings.reload_settings()."""
+    global _SENTRY_ENABLED, _USAGE_ENABLED, _PERF_ENABLED, _SENTRY_SLOW_OP_MS
+    source = new_settings or settings
+    _SENTRY_ENABLED = source.enable_sentry
+    _USAGE_ENABLED = source.enable_usage_analytics
+    _PERF_ENABLED = source.enable_performance_tracking
+    _SENTRY_SLOW_OP_MS = source.sentry_slow_op_ms
+
+
+register_reload_hook(_refresh_flags)
+
+
+def track_performance_decorator(operation: str):
+    """Decorator to track function performance."""
+
+    def decorator(func: Callable) -> Callable:
+        # Times the call inline rather than entering track_performance, which
+        # would allocate a context-manager generator per call
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not (_PERF_ENABLED or _SENTRY_ENABLED):
+                return func(*args, **kwargs)
+
+            start_ns = _perf_counter_ns()
+            error = None
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                _finish_operation(operation, start_ns, error, {})
+
+        return wrapper
+
+    return decorator
+
+
+# (method, path) -> interned tracker key; capped because paths carrying ids
+# (e.g. /api/history/<clip_id>) are unbounded
+_API_KEY_CACHE: dict = {}
+_API_KEY_CACHE_MAX = 1024
+
+
+def api_operation_key(method: str, path: str) -> str:
+    """Performance-tracker operation name for an API request."""
+    key = _API_KEY_CACHE.get((method, path))
+    if key is None:
+        key = sys.intern(f"api_{method.lower()}_{path}")
+        if len(_API_KEY_CACHE) < _API_KEY_CACHE_MAX:
+            _API_KEY_CACHE[(method, path)] = key
+    return key
+
+
+def prewarm_api_metrics(routes: Iterable[Any]):
+    """Intern tracker keys for every fixed-path route (path-parameter routes are skipped)."""
+    if not _PERF_ENABLED:
+        return
+    performance_tracker.prewarm(
+        api_operation_key(method, route.path)
+        for route in routes
+        if "{" not in getattr(route, "path", "{")
+        for method in getattr(route, "methods", None) or ()
+    )
+
+
+def track_api_request(method: str, path: str, status_code: int, duration_ms: float):
+    """Track API request metrics."""
+    if _USAGE_ENABLED:
+        # The per-event kwargs only feed the debug log; don't build them otherwise
+        if logger.isEnabledFor(logging.DEBUG):
+            usage_analytics.track_event(
+                "api_requests",
+                method=method,
+                path=path,
+                status_code=status_code,
+            )
+        else:
+            usage_analytics.increment("api_requests")
+
+    if _PERF_ENABLED:
+        performance_tracker.record(
+            api_operation_key(method, path),
+            duration_ms,
+            method=method,
+            path=path,
+            status_code=status_code,
+        )
+
+
+def track_clipboard_event(event_type: str, **kwargs):
+    """Track clipboard event."""
+    if _USAGE_ENABLED:
+        if logger.isEnabledFor(logging.DEBUG):
+            usage_analytics.track_event(
+                "clipboard_events", clipboard_event_type=event_type, **kwargs
+            )
+        else:
+            usage_analytics.increment("clipboard_events")
+
+
+def capture_exception(error: Exception, context: Optional[dict] = None):
+    """Capture exception to Sentry and logs."""
+    logger.error(f"Exception captured: {str(error)}", exc_info=True, extra=context or {})
+
+    if _SENTRY_ENABLED:
+        # On the caller's thread, so the event keeps its request scope
+        if context:
+            with sentry_sdk.push_scope() as scope:
+                for key, value in context.items():
+                    scope.set_context(key, value)
+                sentry_sdk.capture_exception(error)
+        else:
+            sentry_sdk.capture_exception(error)
+
+    if _USAGE_ENABLED:
+        usage_analytics.track_event("errors", error_type=type(error).__name__)
+
+
+def capture_message(message: str, level: str = "info", **kwargs):
+    """Capture a message to Sentry."""
+    if _SENTRY_ENABLED:
+        sentry_sdk.capture_message(message, level=level)
+
+    log_level = getattr(logger, level.lower(), logger.info)
+    log_level(message, extra=kwargs)
+
+
+def add_breadcrumb(message: str, category: str = "default", level: str = "info", **data):
+    """Add a breadcrumb for debugging context."""
+    if _SENTRY_ENABLED:
+        sentry_sdk.add_breadcrumb(message=message, category=category, level=level, data=data)
+
+
+def get_monitoring_stats() -> dict:
+    """Get all monitoring statistics."""
+    return {
+        "performance": performance_tracker.get_stats(),
+        "usage": usage_analytics.get_stats(),
+        "sentry_enabled": _SENTRY_ENABLED,
+        "sentry_queue": sentry_dispatcher.get_stats(),
+        "environment": settings.environment,
+    }
@@ -8,8 +8,9 @@ Loads configuration from:
 """
 
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -28,6 +29,7 @@ class Settings(BaseSettings):
     api_port: int = Field(default=49917, env="API_PORT")
     api_reload: bool = Field(default=False, env="API_RELOAD")
     api_workers: int = Field(default=1, env="API_WORKERS")
+    thread_pool_size: int = Field(default=40, env="THREAD_POOL_SIZE")
 
     # Storage Configuration
     data_dir: Path = Field(default=Path("data"), env="DATA_DIR")
@@ -36,6 +38,7 @@ class Settings(BaseSettings):
 
     # Clipboard Configuration
     clipboard_check_interval: float = Field(default=1.0, env="CLIPBOARD_CHECK_INTERVAL")
+    clipboard_checkpoint_every: int = Field(default=20, env="CLIPBOARD_CHECKPOINT_EVERY")
     max_history_size: int = Field(default=100, env="MAX_HISTORY_SIZE")
     max_content_length: int = Field(default=10000, env="MAX_CONTENT_LENGTH")
 
@@ -63,9 +66,12 @@ class Settings(BaseSettings):
     enable_monitoring: bool = Field(default=True, env="ENABLE_MONITORING")
     enable_api: bool = Field(default=True, env="ENABLE_API")
     enable_sentry: bool = Field(default=False, env="ENABLE_SENTRY")
+    sentry_slow_op_ms: int = Field(default=100, env="SENTRY_SLOW_OP_MS")
     enable_usage_analytics: bool = Field(default=True, env="ENABLE_USAGE_ANALYTICS")
     health_check_enabled: bool = Field(default=True, env="HEALTH_CHECK_ENABLED")
+    health_cache_ttl: float = Field(default=2.0, env="HEALTH_CACHE_TTL")
     enable_performance_tracking: bool = Field(default=True, env="ENABLE_PERFORMANCE_TRACKING")
+    enable_request_tracking: bool = Field(default=True, env="ENABLE_REQUEST_TRACKING")
 
     @property
     def is_development(self) -> bool:
@@ -74,20 +80,46 @@ class Settings(BaseSettings):
 
     class Config:
         """Pydantic config."""
-        env_file = ".env"
+        # Test runs configure everything through the environment; skip reading
+        # (and being polluted by) a developer's local .env
+        env_file = None if os.environ.get("ENVIRONMENT") == "test" else ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
 
-    def ensure_directories(self):
-        """Ensure all required directories exist."""
+    @classmethod
+    def for_testing(cls, **overrides) -> "Settings":
+        """
+        Build settings from defaults plus overrides without validation or env/.env reads.
+
+        Only for tests, where every value passed in is already known-good.
+        """
+        return cls.model_construct(**overrides)
+
+    @cached_property
+    def data_path(self) -> Path:
+        """Data directory, created on first access."""
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        return self.data_dir
+
+    @cached_property
+    def log_path(self) -> Path:
+        """Rotating log file path, with its directory created on first access."""
+        path = Path(self.log_file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def ensure_directories(self):
+        """Ensure all required directories exist; called once at app startup."""
+        # Reading the property creates the directory
+        self.data_path  # noqa: B018
 
         if self.log_file:
             log_dir = Path(self.log_file).parent
             log_dir.mkdir(parents=True, exist_ok=True)
 
-    def get_sentry_config(self):
-        """Get Sentry configuration."""
+    @cached_property
+    def sentry_config(self) -> dict:
+        """Sentry configuration, built once; treat it as read-only."""
         return {
             "enabled": self.enable_sentry,
             "dsn": os.getenv("SENTRY_DSN"),
@@ -96,24 +128,29 @@ class Settings(BaseSettings):
         }
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
+# Called with the new instance after reload_settings(), for modules that
+# snapshot values at import time
+_reload_hooks: List[Callable[[Settings], None]] = []
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-        _settings.ensure_directories()
-    return _settings
+    return Settings()
+
+
+def register_reload_hook(hook: Callable[[Settings], None]):
+    """Register a callback to run with the new settings after reload_settings()."""
+    _reload_hooks.append(hook)
 
 
 def reload_settings():
     """Reload settings from environment/file."""
-    global _settings
-    _settings = None
-    return get_settings()
+    get_settings.cache_clear()
+    new_settings = get_settings()
+    for hook in _reload_hooks:
+        hook(new_settings)
+    return new_settings
 
 
 # Create global settings instance for direct import
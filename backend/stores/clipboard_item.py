@@ -6,8 +6,19 @@ Represents individual clipboard items with metadata.
 
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-import hashlib
+from itertools import count
 import re
+import secrets
+
+# Content-type detection patterns, compiled once for every item created
+_URL_RE = re.compile(r"^(?:https?://|www\.)")
+_EMAIL_RE = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+_NUMBER_RE = re.compile(r"^\d+(\.\d+)?$")
+
+# IDs are a random per-process prefix plus a counter: 16 hex chars like the
+# old content hashes, without hashing every clip's content
+_ID_PREFIX = secrets.token_hex(4)
+_id_counter = count()
 
 
 class ClipboardItem:
@@ -31,6 +42,24 @@ class ClipboardItem:
         tags: List of tags for organization
     """
 
+    # Fixed attribute layout: no per-instance __dict__ for the many items held
+    __slots__ = (
+        "content",
+        "timestamp",
+        "source_app",
+        "item_type",
+        "display_length",
+        "content_type",
+        "display_string",
+        "clip_id",
+        "has_name",
+        "snippet_name",
+        "folder_path",
+        "tags",
+        "_response",
+        "_dict",
+    )
+
     def __init__(
         self,
         content: str,
@@ -60,16 +89,27 @@ class ClipboardItem:
         self.folder_path: Optional[str] = None
         self.tags: List[str] = []
 
+        # Cached to_response_dict()/to_dict() results; see touch()
+        self._response: Optional[Dict[str, Any]] = None
+        self._dict: Optional[Dict[str, Any]] = None
+
+    def touch(self):
+        """Drop cached dict representations; call after changing any field."""
+        self._response = None
+        self._dict = None
+
     def _detect_content_type(self) -> str:
         """Detect content type with enhanced auto-categorization."""
         content = self.content.strip()
+        if not content:
+            return "text"
 
         # URL detection (enhanced)
-        if re.match(r"^https?://", content) or re.match(r"^www\.", content):
+        if _URL_RE.match(content):
             return "url"
 
         # Email detection (enhanced)
-        if re.match(r"^[\w\.-]+@[\w\.-]+\.\w+$", content):
+        if _EMAIL_RE.match(content):
             return "email"
 
         # JSON detection
@@ -111,7 +151,7 @@ class ClipboardItem:
             return "code"
 
         # Numeric/calculation detection
-        if re.match(r"^\d+(\.\d+)?$", content):
+        if _NUMBER_RE.match(content):
             return "number"
 
         # Path detection (file/directory paths)
@@ -121,9 +161,8 @@ class ClipboardItem:
         return "text"
 
     def _generate_id(self) -> str:
-        """Generate unique ID from content and timestamp."""
-        data = f"{self.content}{self.timestamp.isoformat()}"
-        return hashlib.md5(data.encode()).hexdigest()[:16]
+        """Generate a unique ID for this process run."""
+        return f"{_ID_PREFIX}{next(_id_counter) & 0xFFFFFFFF:08x}"
 
     def _create_display_string(self) -> str:
         """Create display string for UI."""
@@ -153,12 +192,14 @@ class ClipboardItem:
         self.folder_path = folder
         self.tags = tags or []
         self.item_type = "snippet"
+        self.touch()
         return self
 
     def update_display_length(self, new_length: int):
         """Update display length and regenerate display string."""
         self.display_length = new_length
         self.display_string = self._create_display_string()
+        self.touch()
 
     def matches_search(self, query: str) -> bool:
         """Check if item matches search query."""
@@ -179,21 +220,55 @@ class ClipboardItem:
         return False
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "content": self.content,
-            "timestamp": self.timestamp.isoformat(),
-            "clip_id": self.clip_id,
-            "content_type": self.content_type,
-            "display_length": self.display_length,
-            "display_string": self.display_string,
-            "source_app": self.source_app,
-            "item_type": self.item_type,
-            "has_name": self.has_name,
-            "snippet_name": self.snippet_name,
-            "folder_path": self.folder_path,
-            "tags": self.tags,
-        }
+        """
+        Convert to dictionary for JSON serialization, built once and reused.
+
+        Like to_response_dict(), the cached dict is dropped by touch(), so
+        callers must not mutate it.
+        """
+        data = self._dict
+        if data is None:
+            data = {
+                "content": self.content,
+                "timestamp": self.timestamp.isoformat(),
+                "clip_id": self.clip_id,
+                "content_type": self.content_type,
+                "display_length": self.display_length,
+                "display_string": self.display_string,
+                "source_app": self.source_app,
+                "item_type": self.item_type,
+                "has_name": self.has_name,
+                "snippet_name": self.snippet_name,
+                "folder_path": self.folder_path,
+                "tags": self.tags,
+            }
+            self._dict = data
+        return data
+
+    def to_response_dict(self) -> Dict[str, Any]:
+        """
+        Get the API response representation, built once and reused.
+
+        Same shape as ClipboardItemResponse.model_dump(). The cached dict is
+        dropped by touch(), so callers must not mutate it.
+        """
+        response = self._response
+        if response is None:
+            response = {
+                "clip_id": self.clip_id,
+                "content": self.content,
+                "timestamp": self.timestamp.isoformat(),
+                "content_type": self.content_type,
+                "display_string": self.display_string,
+                "source_app": self.source_app,
+                "item_type": self.item_type,
+                "has_name": self.has_name,
+                "snippet_name": self.snippet_name,
+                "folder_path": self.folder_path,
+                "tags": self.tags,
+            }
+            self._response = response
+        return response
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ClipboardItem":
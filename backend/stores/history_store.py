@@ -5,10 +5,21 @@ Manages recent clipboard history with automatic deduplication,
 size limits, and auto-generated folder ranges.
 """
 
-from typing import List, Optional, Callable, Dict, Any
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Callable, Dict, Any, Iterable, Set, Tuple
 from stores.clipboard_item import ClipboardItem
 
 
+# Clips longer than this stay out of the search index and are scanned instead,
+# so one huge paste can't add hundreds of thousands of index entries
+SEARCH_INDEX_MAX_CHARS = 4096
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of three-character substrings of text."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
 class HistoryStore:
     """
     Manages clipboard history items.
@@ -35,18 +46,46 @@ class HistoryStore:
             display_count: How many to display directly
             display_length: Character limit for display
         """
-        self.max_items = max_items
+        self._max_items = max_items
         self.display_count = display_count
         self.display_length = display_length
 
         # Storage
         self.items: List[ClipboardItem] = []
 
+        # Lookups over self.items, each built lazily on first use and rebuilt
+        # whenever self.items is replaced wholesale.
+        # content -> item for O(1) duplicate checks, clip_id -> item for
+        # O(1) lookups by ID:
+        self._by_content: Dict[str, ClipboardItem] = {}
+        self._by_id: Dict[str, ClipboardItem] = {}
+        self._lookup_items: Optional[List[ClipboardItem]] = None
+        # Search index, built on the first search: lowercased-content trigram
+        # -> ids of items containing it, plus ids of clips too long to index
+        self._index: Dict[str, Set[int]] = {}
+        self._unindexed: Set[int] = set()
+        self._indexed_items: Optional[List[ClipboardItem]] = None
+
         # Dirty flag for persistence
         self.modified = False
 
         # Delegate callbacks for UI updates
-        self._delegates: List[Callable] = []
+        # Copy-on-write: notifications iterate a stable tuple, so delegates may
+        # add/remove delegates mid-notification without skipping anyone
+        self._delegates: Tuple[Callable, ...] = ()
+        # Nesting depth of silent() blocks; notifications are held while > 0
+        self._silent_depth = 0
+
+    @property
+    def max_items(self) -> int:
+        """Maximum number of items kept in history."""
+        return self._max_items
+
+    @max_items.setter
+    def max_items(self, value: int):
+        if value != self._max_items:
+            self._max_items = value
+            self._notify_delegates("max_items_changed", value)
 
     def insert(self, item: ClipboardItem, index: int = 0) -> bool:
         """Insert item with duplicate handling. Returns True if inserted."""
@@ -59,21 +98,57 @@ class HistoryStore:
         self._notify_delegates("will_insert", index, item)
         self.items.insert(index, item)
         self.modified = True
+        self._lookup_add(item)
+        self._index_add(item)
 
         # Enforce size limit
         if len(self.items) > self.max_items:
             removed = self.items.pop()
+            self._lookup_remove(removed)
+            self._index_remove(removed)
             self._notify_delegates("did_delete", len(self.items), removed)
 
         self._notify_delegates("did_insert", index, item)
         return True
 
+    def insert_many(self, items: Iterable[ClipboardItem]) -> int:
+        """
+        Insert a batch of items as if each were inserted at the top in order.
+
+        Duplicates are resolved with one pass over the store and the size
+        limit is enforced once. Returns the number of new items inserted.
+        """
+        # Last occurrence wins, matching repeated insert() calls
+        latest: Dict[str, ClipboardItem] = {}
+        for item in items:
+            latest.pop(item.content, None)
+            latest[item.content] = item
+        if not latest:
+            return 0
+
+        existing = {item.content: item for item in self.items}
+        top = [existing.get(content, item) for content, item in reversed(latest.items())]
+        inserted = sum(1 for content in latest if content not in existing)
+        self.items[:] = top + [item for item in self.items if item.content not in latest]
+        del self.items[self.max_items :]
+        self.modified = True
+        self._lookup_items = None
+        self._indexed_items = None
+
+        self._notify_delegates("did_insert_many", inserted)
+        return inserted
+
     def find_duplicate(self, item: ClipboardItem) -> int:
         """Find duplicate by content. Returns index or -1."""
-        for i, existing_item in enumerate(self.items):
-            if existing_item.content == item.content:
-                return i
-        return -1
+        self._ensure_lookups()
+        existing = self._by_content.get(item.content)
+        if existing is None:
+            return -1
+        if existing.content != item.content:
+            # Content was edited in place since it was keyed; rebuild and retry
+            self._lookup_items = None
+            return self.find_duplicate(item)
+        return self._position(existing)
 
     def move_to_top(self, index: int):
         """Move item at index to top."""
@@ -99,29 +174,23 @@ class HistoryStore:
         Returns:
             List of folder dictionaries with name and items
         """
-        folders = []
         total_items = len(self.items)
+        size = self.display_count
 
-        # Skip first display_count items (they show directly)
-        start_index = self.display_count
-
-        while start_index < total_items:
-            end_index = min(start_index + self.display_count - 1, total_items - 1)
-            folder_name = f"{start_index + 1}-{end_index + 1}"
-            folder_items = self.items[start_index : end_index + 1]
-
+        # Skip first display_count items (they show directly); the ranges
+        # follow from the counts alone, so only the slices touch the items
+        folders = []
+        for start_index in range(size, total_items, size):
+            end_index = min(start_index + size, total_items) - 1
             folders.append(
                 {
-                    "name": folder_name,
+                    "name": f"{start_index + 1}-{end_index + 1}",
                     "start_index": start_index,
                     "end_index": end_index,
-                    "items": folder_items,
-                    "count": len(folder_items),
+                    "items": self.items[start_index : end_index + 1],
+                    "count": end_index - start_index + 1,
                 }
             )
-
-            start_index = end_index + 1
-
         return folders
 
     def delete_item(self, index: int) -> Optional[ClipboardItem]:
@@ -129,32 +198,140 @@ class HistoryStore:
         if 0 <= index < len(self.items):
             item = self.items.pop(index)
             self.modified = True
+            self._lookup_remove(item)
+            self._index_remove(item)
             self._notify_delegates("did_delete", index, item)
             return item
         return None
 
+    def get_item_by_id(self, clip_id: str) -> Optional[ClipboardItem]:
+        """Find item by ID."""
+        self._ensure_lookups()
+        return self._by_id.get(clip_id)
+
+    def delete_item_by_id(self, clip_id: str) -> Optional[ClipboardItem]:
+        """Delete item by ID."""
+        item = self.get_item_by_id(clip_id)
+        if item is None:
+            return None
+        return self.delete_item(self._position(item))
+
+    def _position(self, item: ClipboardItem) -> int:
+        """Index of this exact item; list.index() would match on content."""
+        return next(i for i, existing in enumerate(self.items) if existing is item)
+
     def clear(self):
         """Clear all history items."""
         self.items.clear()
         self.modified = True
+        self._lookup_items = None
+        self._indexed_items = None
         self._notify_delegates("store_cleared")
 
     def search(self, query: str) -> List[ClipboardItem]:
         """Search items matching query."""
-        return [item for item in self.items if item.matches_search(query)]
+        query_lower = query.lower()
+        if len(query_lower) < 3:
+            return [item for item in self.items if item.matches_search(query)]
+
+        # Only contents holding every query trigram can contain the query;
+        # names, tags and over-long clips are not indexed, so those are checked
+        index = self._ensure_index()
+        postings = sorted((index.get(gram, ()) for gram in _trigrams(query_lower)), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        candidates |= self._unindexed
+        return [
+            item
+            for item in self.items
+            if (id(item) in candidates or item.snippet_name or item.tags)
+            and item.matches_search(query)
+        ]
+
+    def _ensure_lookups(self):
+        """Rebuild the content and ID lookups if items were replaced."""
+        if self._lookup_items is not self.items:
+            self._by_content = {}
+            self._by_id = {}
+            self._lookup_items = self.items
+            for item in self.items:
+                self._lookup_add(item)
+
+    def _lookup_add(self, item: ClipboardItem):
+        """Add an item to the content and ID lookups if they are live."""
+        if self._lookup_items is self.items:
+            self._by_content.setdefault(item.content, item)
+            self._by_id.setdefault(item.clip_id, item)
+
+    def _lookup_remove(self, item: ClipboardItem):
+        """Drop an item from the content and ID lookups if they are live."""
+        if self._lookup_items is self.items:
+            if self._by_content.get(item.content) is item:
+                del self._by_content[item.content]
+            if self._by_id.get(item.clip_id) is item:
+                del self._by_id[item.clip_id]
+
+    def _ensure_index(self) -> Dict[str, Set[int]]:
+        """Return the search index, rebuilding it if items were replaced."""
+        if self._indexed_items is not self.items:
+            self._index = {}
+            self._unindexed = set()
+            self._indexed_items = self.items
+            for item in self.items:
+                self._index_add(item)
+        return self._index
+
+    def _index_add(self, item: ClipboardItem):
+        """Add an item to the search index if it has been built."""
+        if self._indexed_items is self.items:
+            if len(item.content) > SEARCH_INDEX_MAX_CHARS:
+                self._unindexed.add(id(item))
+                return
+            for gram in _trigrams(item.content.lower()):
+                self._index.setdefault(gram, set()).add(id(item))
+
+    def _index_remove(self, item: ClipboardItem):
+        """Drop an item from the search index if it has been built."""
+        if self._indexed_items is self.items:
+            if id(item) in self._unindexed:
+                self._unindexed.discard(id(item))
+                return
+            for gram in _trigrams(item.content.lower()):
+                ids = self._index.get(gram)
+                if ids is not None:
+                    ids.discard(id(item))
+                    if not ids:
+                        del self._index[gram]
 
     def add_delegate(self, callback: Callable):
         """Add delegate callback for store updates."""
         if callback not in self._delegates:
-            self._delegates.append(callback)
+            self._delegates = (*self._delegates, callback)
 
     def remove_delegate(self, callback: Callable):
         """Remove delegate callback."""
         if callback in self._delegates:
-            self._delegates.remove(callback)
+            self._delegates = tuple(d for d in self._delegates if d != callback)
+
+    @contextmanager
+    def silent(self) -> Iterator["HistoryStore"]:
+        """
+        Suppress per-item delegate notifications for a batch of changes.
+
+        Delegates get a single "store_changed" event when the outermost
+        block exits, instead of one event per insert/move/delete inside it.
+        """
+        self._silent_depth += 1
+        try:
+            yield self
+        finally:
+            self._silent_depth -= 1
+            if not self._silent_depth:
+                self._notify_delegates("store_changed")
 
     def _notify_delegates(self, event: str, *args):
         """Notify all delegates of an event."""
+        if self._silent_depth:
+            return
         for delegate in self._delegates:
             try:
                 delegate(event, *args)
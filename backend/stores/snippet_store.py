@@ -6,7 +6,7 @@ Manages organized snippet folders for reusable text clips.
 
 import logging
 import re
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 from stores.clipboard_item import ClipboardItem
 
 logger = logging.getLogger(__name__)
@@ -29,7 +29,9 @@ class SnippetStore:
         """Initialize SnippetStore."""
         self.folders: Dict[str, List[ClipboardItem]] = {}
         self.modified = False
-        self._delegates: List[Callable] = []
+        # Copy-on-write: notifications iterate a stable tuple, so delegates may
+        # add/remove delegates mid-notification without skipping anyone
+        self._delegates: Tuple[Callable, ...] = ()
 
     def create_folder(self, folder_name: str) -> bool:
         """Create new folder."""
@@ -76,6 +78,7 @@ class SnippetStore:
             self.folders[new_name] = self.folders.pop(old_name)
             for item in self.folders[new_name]:
                 item.folder_path = new_name
+                item.touch()
             self.modified = True
             self._notify_delegates("folder_renamed", old_name, new_name)
             logger.info(f"rename_folder: SUCCESS - '{old_name}' -> '{new_name}'")
@@ -104,6 +107,7 @@ class SnippetStore:
         if not item.has_name:
             item.make_snippet(name=item.snippet_name or item.display_string, folder=folder_name)
         item.folder_path = folder_name
+        item.touch()
         self.folders[folder_name].append(item)
         self.modified = True
         self._notify_delegates("snippet_added", folder_name, item)
@@ -139,6 +143,7 @@ class SnippetStore:
                     item.snippet_name = new_name
                 if new_tags is not None:
                     item.tags = new_tags
+                item.touch()
                 self.modified = True
                 self._notify_delegates("snippet_updated", folder_name, item)
                 return True
@@ -152,6 +157,7 @@ class SnippetStore:
             if item.clip_id == clip_id:
                 snippet = self.folders[from_folder].pop(i)
                 snippet.folder_path = to_folder
+                snippet.touch()
                 if to_folder not in self.folders:
                     self.create_folder(to_folder)
                 self.folders[to_folder].append(snippet)
@@ -190,12 +196,12 @@ class SnippetStore:
     def add_delegate(self, callback: Callable):
         """Add delegate callback for store updates."""
         if callback not in self._delegates:
-            self._delegates.append(callback)
+            self._delegates = (*self._delegates, callback)
 
     def remove_delegate(self, callback: Callable):
         """Remove delegate callback."""
         if callback in self._delegates:
-            self._delegates.remove(callback)
+            self._delegates = tuple(d for d in self._delegates if d != callback)
 
     def _notify_delegates(self, event: str, *args):
         """Notify all delegates of an event."""
@@ -66,6 +66,16 @@ def test_get_history_folders(client):
     assert isinstance(response.json(), list)
 
 
+def test_history_folders_refresh_after_change(client):
+    """Test cached history folders pick up newly added items."""
+    test_client, manager = client
+    manager.history_store.display_count = 2
+    manager.add_clips_bulk(["one", "two", "three"])
+    assert [f["count"] for f in test_client.get("/api/history/folders").json()] == [1]
+    manager.add_clip("four")
+    assert [f["count"] for f in test_client.get("/api/history/folders").json()] == [2]
+
+
 def test_delete_history_item(client):
     """Test deleting history item."""
     test_client, manager = client
@@ -90,3 +100,14 @@ def test_clear_history(client):
     response = test_client.delete("/api/history")
     assert response.status_code == 200
     assert response.json()["success"] is True
+
+
+def test_history_cache_invalidated_on_change(client):
+    """Test cached history reflects clips added and deleted between reads."""
+    test_client, manager = client
+    manager.clear_history()
+    assert test_client.get("/api/history").json() == []
+    item = manager.add_clip("fresh clip")
+    assert [h["clip_id"] for h in test_client.get("/api/history").json()] == [item.clip_id]
+    test_client.delete(f"/api/history/{item.clip_id}")
+    assert test_client.get("/api/history").json() == []
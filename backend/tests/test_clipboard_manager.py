@@ -1,9 +1,11 @@
 """Tests for clipboard manager core functionality."""
 
+import os
 import pytest
 import tempfile
 import shutil
 from clipboard_manager import ClipboardManager
+from stores.clipboard_item import ClipboardItem
 
 
 @pytest.fixture
@@ -22,6 +24,45 @@ def test_add_clip(manager):
     assert len(manager.history_store) == 1
 
 
+def test_concurrent_add_clip_and_save(manager, capsys):
+    """Test threaded add_clip/save_stores neither fail nor corrupt the files."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    manager.history_store.max_items = 200
+
+    def work(i):
+        manager.add_clip(f"thread clip {i}")
+        manager.save_stores()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(work, range(100)))
+
+    assert "Error saving stores" not in capsys.readouterr().out
+    assert len(manager.history_store) == 100
+    assert not [name for name in os.listdir(manager.data_dir) if name.endswith(".tmp")]
+    reloaded = ClipboardManager(data_dir=manager.data_dir, max_history=200)
+    assert len(reloaded.history_store) == 100
+
+
+def test_replace_state_bumps_version(manager):
+    """Test swapping stores wholesale invalidates version-keyed caches."""
+    item = ClipboardItem(content="swapped in")
+    version = manager.version
+    manager.replace_state([item], {"Folder": []})
+    assert manager.version != version
+    assert manager.get_all_history() == [item]
+    assert manager.get_snippet_folders() == ["Folder"]
+
+
+def test_add_clips_bulk_matches_add_clip(manager):
+    """Test bulk insertion orders, dedups and trims like repeated add_clip()."""
+    manager.history_store.max_items = 3
+    manager.add_clip("a")
+    manager.add_clips_bulk(["b", "a", "c", "b", "d"])
+
+    assert [item.content for item in manager.history_store.items] == ["d", "b", "c"]
+
+
 def test_save_and_load_stores(manager):
     """Test persistence."""
     manager.add_clip("test1")
@@ -33,6 +74,18 @@ def test_save_and_load_stores(manager):
     assert len(new_manager.snippet_store) > 0
 
 
+def test_add_clip_without_save_defers_write(manager):
+    """Test that save=False leaves the change pending for a later checkpoint."""
+    manager.add_clip("batched", save=False)
+    assert manager.history_store.modified is True
+    assert not os.path.exists(manager.history_file)
+
+    manager.save_stores()
+    assert manager.history_store.modified is False
+    assert os.path.exists(manager.history_file)
+    assert not os.path.exists(manager.history_file + ".tmp")
+
+
 def test_search(manager):
     """Test search functionality."""
     manager.add_clip("searchable text")
@@ -45,6 +98,69 @@ def test_search(manager):
     assert len(results["snippets"]) == 1
 
 
+def test_history_search_index_tracks_changes(manager):
+    """Test indexed history search follows inserts, deletes and reloads."""
+    manager.history_store.max_items = 2
+    manager.add_clip("Alpha Python")
+    manager.add_clip("beta python")
+    assert len(manager.history_store.search("PYTHON")) == 2
+
+    manager.add_clip("gamma")
+    assert [item.content for item in manager.history_store.search("python")] == [
+        "beta python"
+    ]
+
+    manager.delete_history_item(manager.history_store.items[1].clip_id)
+    assert manager.history_store.search("python") == []
+
+    manager.history_store.items = [ClipboardItem("reloaded python")]
+    assert len(manager.history_store.search("python")) == 1
+
+
+def test_history_search_index_is_lazy_and_skips_long_clips(manager, monkeypatch):
+    """Test the search index waits for a search and leaves long clips to a scan."""
+    import stores.history_store as history_store_module
+
+    monkeypatch.setattr(history_store_module, "SEARCH_INDEX_MAX_CHARS", 20)
+    store = manager.history_store
+    manager.add_clip("short python")
+    assert store._index == {}
+
+    long_clip = manager.add_clip("a much longer python clip")
+    assert [item.content for item in store.search("python")] == [
+        long_clip.content,
+        "short python",
+    ]
+    assert all(id(long_clip) not in ids for ids in store._index.values())
+
+
+def test_history_delete_by_id_removes_that_item(manager):
+    """Test delete by ID removes the matching object even if contents collide."""
+    store = manager.history_store
+    first = manager.add_clip("same")
+    second = manager.add_clip("other")
+    second.content = "same"
+
+    assert store.delete_item_by_id(second.clip_id) is second
+    assert store.items == [first] and store.items[0] is first
+    assert store.get_item_by_id(first.clip_id) is first
+
+
+def test_history_silent_batches_notifications(manager):
+    """Test silent() replaces per-item delegate events with one at the end."""
+    events = []
+    manager.history_store.add_delegate(lambda event, *args: events.append(event))
+
+    with manager.history_store.silent():
+        with manager.history_store.silent():
+            for i in range(3):
+                manager.add_clip(f"clip {i}", save=False)
+        assert events == []
+
+    assert events == ["store_changed"]
+    assert len(manager.history_store) == 3
+
+
 def test_export_import(manager):
     """Test export and import."""
     manager.add_snippet_direct("export test", "Test", "Folder", ["tag"])
@@ -74,6 +190,17 @@ def test_save_as_snippet(manager):
     assert snippet.snippet_name == "MySnippet"
 
 
+def test_snippet_edit_leaves_history_dedup_intact(manager):
+    """Test editing a saved snippet doesn't make its old text a history duplicate."""
+    item = manager.add_clip("old text")
+    snippet = manager.save_as_snippet(item.clip_id, "Name", "Folder")
+    manager.update_snippet("Folder", snippet.clip_id, new_content="new text")
+
+    manager.add_clip("old text")
+    assert [clip.content for clip in manager.history_store.items] == ["old text"]
+    assert manager.get_folder_snippets("Folder")[0].content == "new text"
+
+
 def test_delete_history(manager):
     """Test deleting history item."""
     item = manager.add_clip("delete this")
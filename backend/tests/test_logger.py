@@ -0,0 +1,29 @@
+"""Tests for logging configuration."""
+
+import logging
+import queue
+
+import orjson
+from logger import OrjsonFormatter, RecordQueueHandler
+
+
+def test_queued_json_record_keeps_exc_info():
+    """Test the JSON output of a queued error keeps the traceback in exc_info."""
+    log_queue = queue.SimpleQueue()
+    test_logger = logging.getLogger("simplecp.test_queue")
+    test_logger.propagate = False
+    handler = RecordQueueHandler(log_queue)
+    test_logger.addHandler(handler)
+    try:
+        try:
+            raise ValueError("x")
+        except ValueError:
+            test_logger.error("boom %s", "x", exc_info=True)
+    finally:
+        test_logger.removeHandler(handler)
+
+    record = log_queue.get_nowait()
+    output = orjson.loads(OrjsonFormatter("%(levelname)s %(message)s").format(record))
+    assert output["message"] == "boom x"
+    assert "Traceback" in output["exc_info"]
+    assert "ValueError: x" in output["exc_info"]
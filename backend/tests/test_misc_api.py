@@ -44,6 +44,20 @@ def test_search_get(client):
     assert "snippets" in data
 
 
+def test_export_date_stamped_per_request(client, monkeypatch):
+    """Test cached export bodies still carry a fresh export_date."""
+    test_client, manager = client
+    manager.add_snippet_direct("export me", "E", "Export")
+    first = test_client.get("/api/export").json()
+    monkeypatch.setattr(
+        manager, "export_envelope",
+        lambda: {"version": "1.0", "export_date": "later", "metadata": {}},
+    )
+    second = test_client.get("/api/export").json()
+    assert second["export_date"] == "later"
+    assert second["snippets"] == first["snippets"]
+
+
 def test_search_post(client):
     """Test POST search."""
     test_client, manager = client
@@ -52,6 +66,19 @@ def test_search_post(client):
     assert response.status_code == 200
 
 
+def test_search_cache_invalidated_on_change(client):
+    """Test repeated searches pick up newly added items."""
+    test_client, manager = client
+    manager.add_clip("cached query one")
+    assert len(test_client.get("/api/search?q=Cached").json()["history"]) == 1
+    manager.add_clip("cached query two")
+    assert len(test_client.get("/api/search?q=cached").json()["history"]) == 2
+    response = test_client.post(
+        "/api/search", json={"query": "cached", "include_history": False}
+    )
+    assert response.json()["history"] == []
+
+
 def test_get_stats(client):
     """Test stats endpoint."""
     test_client, _ = client
@@ -62,6 +89,14 @@ def test_get_stats(client):
     assert "snippet_count" in data
 
 
+def test_stats_reflect_max_history_change(client):
+    """Test cached stats are refreshed when max_history changes."""
+    test_client, manager = client
+    assert test_client.get("/api/stats").json()["max_history"] == 50
+    manager.history_store.max_items = 20
+    assert test_client.get("/api/stats").json()["max_history"] == 20
+
+
 def test_get_status(client):
     """Test status endpoint."""
     test_client, _ = client
@@ -88,3 +123,55 @@ def test_import_snippets(client):
     import_data = {"version": "1.0", "snippets": []}
     response = test_client.post("/api/import", json=import_data)
     assert response.status_code == 200
+
+
+def test_item_dicts_match_response_model(client):
+    """Test batch item conversion matches ClipboardItemResponse output."""
+    from api.models import clipboard_item_to_response, clipboard_items_to_dicts
+
+    _, manager = client
+    clip = manager.add_clip("https://example.com")
+    snippet = manager.add_snippet_direct("snippet body", "Name", "Folder", ["tag"])
+    for item in (clip, snippet):
+        assert clipboard_items_to_dicts([item]) == [clipboard_item_to_response(item).model_dump()]
+
+
+def test_item_dict_refreshed_after_update(client):
+    """Test the cached item representation follows snippet edits."""
+    test_client, manager = client
+    snippet = manager.add_snippet_direct("before", "Name", "Folder", [])
+    assert snippet.to_response_dict()["content"] == "before"
+    manager.update_snippet("Folder", snippet.clip_id, new_content="after")
+    manager.rename_snippet_folder("Folder", "Renamed")
+    item = test_client.get("/api/snippets/Renamed").json()[0]
+    assert item["content"] == "after"
+    assert item["folder_path"] == "Renamed"
+
+
+def test_item_to_dict_cached_until_update(client):
+    """Test the persisted item dict is reused until a field changes."""
+    _, manager = client
+    snippet = manager.add_snippet_direct("before", "Name", "Folder", [])
+    data = snippet.to_dict()
+    assert snippet.to_dict() is data
+    manager.update_snippet("Folder", snippet.clip_id, new_content="after")
+    assert snippet.to_dict()["content"] == "after"
+
+
+def test_streamed_responses_match_cached(client, monkeypatch):
+    """Test streamed history/export bodies match the non-streamed ones."""
+    import api.endpoints
+
+    test_client, manager = client
+    for i in range(3):
+        manager.add_clip(f"stream clip {i}")
+        manager.add_snippet_direct(f"stream snippet {i}", f"S{i}", "Stream")
+    history = test_client.get("/api/history").json()
+    export = test_client.get("/api/export").json()
+
+    monkeypatch.setattr(api.endpoints, "STREAM_MIN_ITEMS", 1)
+    monkeypatch.setattr(api.endpoints, "STREAM_BATCH_SIZE", 2)
+    assert test_client.get("/api/history").json() == history
+    streamed = test_client.get("/api/export").json()
+    assert streamed["snippets"] == export["snippets"]
+    assert streamed["metadata"] == export["metadata"]
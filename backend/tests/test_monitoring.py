@@ -0,0 +1,262 @@
+"""Tests for monitoring helpers."""
+
+from types import SimpleNamespace
+
+import pytest
+import monitoring._core as core
+
+
+class FakeTransaction:
+    """Records what the dispatcher sets on a transaction."""
+
+    def __init__(self, op, name):
+        self.op = op
+        self.measurements = {}
+        self.data = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set_measurement(self, key, value):
+        self.measurements[key] = value
+
+    def set_data(self, key, value):
+        self.data[key] = value
+
+
+class FakeClock:
+    """Stands in for time.perf_counter_ns; advances only when ticked."""
+
+    def __init__(self):
+        self.now_ns = 0
+
+    def __call__(self):
+        return self.now_ns
+
+    def tick(self, ms):
+        self.now_ns += int(ms * 1_000_000)
+
+
+def test_sentry_dispatcher_coalesces_slow_ops(monkeypatch):
+    """Test slow operations in one batch share a single transaction."""
+    transactions = []
+
+    def start_transaction(op, name):
+        transaction = FakeTransaction(op, name)
+        transactions.append(transaction)
+        return transaction
+
+    monkeypatch.setattr(core.sentry_sdk, "start_transaction", start_transaction)
+
+    dispatcher = core.SentryDispatcher()
+    dispatcher._dispatch(
+        [
+            ("slow_op", ("search", 150.0)),
+            ("slow_op", ("search", 300.0)),
+        ]
+    )
+
+    assert len(transactions) == 1
+    assert transactions[0].op == "search"
+    assert transactions[0].measurements == {"duration_ms": 300.0}
+    assert transactions[0].data == {"count": 2}
+
+
+def test_sentry_dispatcher_drops_when_full(monkeypatch):
+    """Test a full queue drops new events and counts them."""
+    dispatcher = core.SentryDispatcher(capacity=2)
+    monkeypatch.setattr(dispatcher, "_start", lambda: None)
+
+    for i in range(3):
+        dispatcher.submit("slow_op", "search", float(i))
+
+    assert dispatcher.get_stats() == {"writes_total": 2, "drops_total": 1, "pending": 2}
+
+
+def test_sentry_events_stay_on_calling_thread(monkeypatch):
+    """Test breadcrumbs and captures are made inline, in call order."""
+    import threading
+
+    calls = []
+    monkeypatch.setattr(core, "_SENTRY_ENABLED", True)
+    monkeypatch.setattr(core, "_USAGE_ENABLED", False)
+    monkeypatch.setattr(
+        core.sentry_sdk,
+        "add_breadcrumb",
+        lambda **crumb: calls.append((crumb["message"], threading.get_ident())),
+    )
+    monkeypatch.setattr(
+        core.sentry_sdk,
+        "capture_message",
+        lambda message, level: calls.append((message, threading.get_ident())),
+    )
+
+    core.add_breadcrumb("first")
+    core.add_breadcrumb("second")
+    core.capture_message("event", level="error")
+
+    me = threading.get_ident()
+    assert calls == [("first", me), ("second", me), ("event", me)]
+
+
+def test_performance_tracker_aggregates():
+    """Test per-operation aggregates and reset."""
+    tracker = core.PerformanceTracker()
+    tracker.record("save", 2.0)
+    tracker.record("save", 4.0)
+    tracker.record("load", 1.0)
+
+    stats = tracker.get_stats()
+    assert stats["save"] == {
+        "count": 2,
+        "total_ms": 6.0,
+        "min_ms": 2.0,
+        "max_ms": 4.0,
+        "avg_ms": 3.0,
+        "p50_ms": 4.0,
+        "p99_ms": 4.0,
+        "histogram": [0, 1, 1] + [0] * 13,
+    }
+    assert stats["load"]["count"] == 1
+    assert tracker.get_stats() is stats
+
+    tracker.reset()
+    assert tracker.get_stats() == {}
+    tracker.record("load", 5.0)
+    assert tracker.get_stats()["load"]["min_ms"] == 5.0
+
+
+def test_performance_tracker_percentile():
+    """Test percentiles come from the log2 bucket counts."""
+    tracker = core.PerformanceTracker()
+    for _ in range(98):
+        tracker.record("search", 0.5)
+    tracker.record("search", 100.0)
+    tracker.record("search", 5000.0)
+
+    assert tracker.percentile("search", 50) == 2.0
+    assert tracker.percentile("search", 99) == 128.0
+    assert tracker.percentile("search", 100) == 5000.0
+    assert tracker.percentile("unknown", 50) is None
+
+
+def test_track_performance_uses_clock(monkeypatch):
+    """Test durations come from the module clock, so no real waiting is needed."""
+    clock = FakeClock()
+    tracker = core.PerformanceTracker()
+    monkeypatch.setattr(core, "_perf_counter_ns", clock)
+    monkeypatch.setattr(core, "performance_tracker", tracker)
+    monkeypatch.setattr(core, "_PERF_ENABLED", True)
+    monkeypatch.setattr(core, "_SENTRY_ENABLED", False)
+
+    with core._track_performance("save"):
+        clock.tick(10)
+    with core._track_performance("save"):
+        clock.tick(20)
+
+    stats = tracker.get_stats()["save"]
+    assert stats["min_ms"] == pytest.approx(10.0)
+    assert stats["max_ms"] == pytest.approx(20.0)
+    assert stats["total_ms"] == pytest.approx(30.0)
+
+
+def test_refresh_flags_disables_track_performance(monkeypatch):
+    """Test disabling every consumer makes an already-imported track_performance a no-op."""
+    for name in (
+        "_SENTRY_ENABLED",
+        "_USAGE_ENABLED",
+        "_PERF_ENABLED",
+        "_SENTRY_SLOW_OP_MS",
+    ):
+        monkeypatch.setattr(core, name, getattr(core, name))
+    track_performance = core.track_performance
+
+    core._refresh_flags(
+        SimpleNamespace(
+            enable_sentry=False,
+            enable_usage_analytics=False,
+            enable_performance_tracking=False,
+            sentry_slow_op_ms=100,
+        )
+    )
+    assert core.track_performance is track_performance
+    assert track_performance("save") is core._NOOP_CONTEXT
+    assert core._USAGE_ENABLED is False
+
+
+def test_track_performance_decorator_records_calls(monkeypatch):
+    """Test the decorator records each call and re-raises errors."""
+    tracker = core.PerformanceTracker()
+    monkeypatch.setattr(core, "performance_tracker", tracker)
+    monkeypatch.setattr(core, "_PERF_ENABLED", True)
+    monkeypatch.setattr(core, "_SENTRY_ENABLED", False)
+
+    @core.track_performance_decorator("double")
+    def double(value):
+        if value is None:
+            raise ValueError("no value")
+        return value * 2
+
+    assert double(2) == 4
+    with pytest.raises(ValueError):
+        double(None)
+
+    assert tracker.get_stats()["double"]["count"] == 2
+
+
+def test_prewarm_interns_without_reporting(monkeypatch):
+    """Test prewarmed operations stay out of stats until recorded."""
+    tracker = core.PerformanceTracker()
+    monkeypatch.setattr(core, "performance_tracker", tracker)
+    monkeypatch.setattr(core, "_PERF_ENABLED", True)
+
+    routes = [
+        SimpleNamespace(path="/api/history", methods={"GET"}),
+        SimpleNamespace(path="/api/history/{clip_id}", methods={"DELETE"}),
+    ]
+    core.prewarm_api_metrics(routes)
+
+    assert list(tracker._ids) == ["api_get_/api/history"]
+    assert tracker.get_stats() == {}
+
+
+def test_usage_analytics_counts_known_events():
+    """Test known events are counted and unknown ones ignored."""
+    analytics = core.UsageAnalytics()
+    analytics.track_event("api_requests", path="/api/history")
+    analytics.increment("api_requests")
+    analytics.increment("errors")
+    analytics.increment("not_an_event")
+
+    stats = analytics.get_stats()
+    assert stats["api_requests"] == 2
+    assert stats["errors"] == 1
+    assert set(stats) == {
+        "clipboard_events",
+        "api_requests",
+        "history_operations",
+        "snippet_operations",
+        "search_queries",
+        "errors",
+    }
+
+    analytics.reset()
+    assert not any(analytics.get_stats().values())
+
+
+def test_make_before_send_tags_events():
+    """Test the before_send hook tags events, or drops them when asked."""
+    before_send = core.make_before_send("1.2.3", "production")
+    assert before_send({}, None) == {
+        "tags": {"app_version": "1.2.3", "environment": "production"}
+    }
+    assert before_send({"tags": {"component": "api"}}, None)["tags"] == {
+        "component": "api",
+        "app_version": "1.2.3",
+        "environment": "production",
+    }
+
+    assert core.make_before_send("1.2.3", "development", drop_events=True)({}, None) is None
@@ -0,0 +1,69 @@
+"""Tests for process helpers."""
+
+import os
+import shutil
+import socket
+import subprocess
+
+import pytest
+from utils.process import find_pids_on_port, is_process_alive, wait_for_exit
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/net"), reason="requires /proc")
+def test_find_pids_on_port_finds_listener():
+    """Test a listening socket is traced back to this process."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        s.listen()
+        port = s.getsockname()[1]
+        assert find_pids_on_port(port) == [os.getpid()]
+
+
+def test_find_pids_on_port_unused():
+    """Test an unused port yields no PIDs."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    assert find_pids_on_port(port) == []
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/net"), reason="requires /proc")
+def test_listening_ports_includes_listener():
+    """Test listening_ports reports a freshly opened listener."""
+    from utils.process import listening_ports
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        s.listen()
+        assert s.getsockname()[1] in listening_ports()
+
+
+@pytest.mark.skipif(shutil.which("lsof") is None, reason="requires lsof")
+def test_find_pids_with_lsof_finds_listener():
+    """Test the posix_spawn lsof fallback finds a listening socket."""
+    from utils.process import _find_pids_with_lsof
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        s.listen()
+        assert _find_pids_with_lsof(s.getsockname()[1]) == [os.getpid()]
+
+
+def test_is_process_alive():
+    """Test the signal-0 probe for live and reaped processes."""
+    assert is_process_alive(os.getpid()) is True
+
+    proc = subprocess.Popen(["true"])
+    proc.wait()
+    assert is_process_alive(proc.pid) is False
+
+
+def test_wait_for_exit_returns_survivors():
+    """Test wait_for_exit reports processes that outlive the timeout."""
+    proc = subprocess.Popen(["sleep", "5"])
+    try:
+        assert wait_for_exit([proc.pid], timeout=0.05) == [proc.pid]
+    finally:
+        proc.kill()
+        proc.wait()
+    assert wait_for_exit([proc.pid], timeout=0.05) == []
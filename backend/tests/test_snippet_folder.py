@@ -35,6 +35,16 @@ def test_get_snippet_folders(client):
     assert isinstance(response.json(), list)
 
 
+def test_folders_alias(client):
+    """Test /api/folders lists the same folders as /api/snippets/folders."""
+    test_client, manager = client
+    manager.create_snippet_folder("AliasFolder")
+    response = test_client.get("/api/folders")
+    assert response.status_code == 200
+    assert "AliasFolder" in response.json()
+    assert response.json() == test_client.get("/api/snippets/folders").json()
+
+
 def test_create_snippet_from_history(client):
     """Test creating snippet from history."""
     test_client, manager = client
@@ -278,3 +288,25 @@ def test_folder_delegate_error_handling(client):
 
     # Clean up
     manager.snippet_store.remove_delegate(bad_delegate)
+
+
+def test_delegate_removed_during_notification():
+    """Test a delegate removing itself mid-notification doesn't skip the next one."""
+    from stores.snippet_store import SnippetStore
+
+    store = SnippetStore()
+    calls = []
+
+    def one_shot(event, *args):
+        calls.append("one_shot")
+        store.remove_delegate(one_shot)
+
+    def listener(event, *args):
+        calls.append("listener")
+
+    store.add_delegate(one_shot)
+    store.add_delegate(listener)
+    store.create_folder("First")
+    store.create_folder("Second")
+
+    assert calls == ["one_shot", "listener", "listener"]
@@ -0,0 +1,16 @@
+"""
+Utilities package for SimpleCP.
+
+Contains helpers shared by the entry points:
+- process: Find listening ports and the processes holding them, and wait
+  for those processes to exit
+"""
+
+from utils.process import (
+    find_pids_on_port,
+    is_process_alive,
+    listening_ports,
+    wait_for_exit,
+)
+
+__all__ = ['find_pids_on_port', 'is_process_alive', 'listening_ports', 'wait_for_exit']
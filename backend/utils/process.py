@@ -0,0 +1,185 @@
+"""
+Process helpers for SimpleCP.
+
+Finds the processes holding a listening socket on a port. psutil answers this
+in one call when it is installed; otherwise Linux reads /proc directly and
+other platforms fall back to lsof.
+"""
+
+import os
+import time
+from typing import Iterator, List, Optional, Set, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+PROC_NET_TCP = ("/proc/net/tcp", "/proc/net/tcp6")
+TCP_LISTEN = "0A"
+
+
+def _iter_listeners() -> Iterator[Tuple[int, str]]:
+    """Yield (port, socket inode) for every TCP socket in LISTEN state."""
+    for path in PROC_NET_TCP:
+        try:
+            f = open(path)
+        except OSError:
+            continue
+        with f:
+            next(f, None)  # header
+            for line in f:
+                # sl local_address rem_address st tx:rx tr:when retrnsmt uid timeout inode
+                fields = line.split()
+                if len(fields) < 10 or fields[3] != TCP_LISTEN:
+                    continue
+                yield int(fields[1].rsplit(":", 1)[1], 16), fields[9]
+
+
+def _listening_socket_links(port: int) -> Set[str]:
+    """Return fd link targets ("socket:[inode]") of sockets listening on port."""
+    return {
+        f"socket:[{inode}]" for local_port, inode in _iter_listeners() if local_port == port
+    }
+
+
+def listening_ports() -> Optional[Set[int]]:
+    """
+    Get all local TCP ports in LISTEN state with one read of /proc/net/tcp.
+
+    Returns:
+        Set of ports, or None where /proc is unavailable (macOS)
+    """
+    if not os.path.isdir("/proc/net"):
+        return None
+    return {local_port for local_port, _ in _iter_listeners()}
+
+
+def _find_pids_in_proc(port: int) -> List[int]:
+    """Match listening socket inodes to the processes holding them."""
+    links = _listening_socket_links(port)
+    if not links:
+        return []
+
+    pids = []
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with os.scandir(f"/proc/{entry.name}/fd") as fds:
+                if any(os.readlink(fd.path) in links for fd in fds):
+                    pids.append(int(entry.name))
+        except OSError:
+            # Process exited or belongs to another user
+            continue
+    return pids
+
+
+def _run_lsof(args: List[str]) -> Tuple[int, str]:
+    """Run lsof via posix_spawn, skipping subprocess's fork+exec wrapper."""
+    r, w = os.pipe()
+    try:
+        pid = os.posix_spawnp(
+            "lsof",
+            ["lsof", *args],
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, w, 1),
+                (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+            ],
+        )
+    except OSError:
+        os.close(r)
+        return -1, ""
+    finally:
+        os.close(w)
+
+    chunks = []
+    with os.fdopen(r, "rb") as out:
+        while chunk := out.read1(4096):
+            chunks.append(chunk)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status), b"".join(chunks).decode()
+
+
+def _find_pids_with_lsof(port: int) -> List[int]:
+    """Ask lsof for processes using port (macOS and other non-/proc systems)."""
+    args = ["-t", f"-i:{port}"]
+    if hasattr(os, "posix_spawnp"):
+        returncode, stdout = _run_lsof(args)
+    else:
+        import subprocess
+
+        try:
+            result = subprocess.run(["lsof", *args], capture_output=True, text=True)
+        except OSError:
+            return []
+        returncode, stdout = result.returncode, result.stdout
+    if returncode != 0:
+        return []
+    return [int(pid) for pid in stdout.split() if pid.isdigit()]
+
+
+def _find_pids_with_psutil(port: int) -> List[int]:
+    """Scan the kernel's TCP table through psutil (no fork+exec)."""
+    return sorted(
+        {
+            conn.pid
+            for conn in psutil.net_connections(kind="tcp")
+            if conn.pid and conn.status == psutil.CONN_LISTEN and conn.laddr.port == port
+        }
+    )
+
+
+def find_pids_on_port(port: int) -> List[int]:
+    """
+    Find processes listening on a TCP port.
+
+    Args:
+        port: Local port number
+
+    Returns:
+        List of PIDs (may be empty)
+    """
+    if psutil is not None:
+        try:
+            return _find_pids_with_psutil(port)
+        except psutil.AccessDenied:
+            # macOS needs root to list other processes' sockets
+            pass
+    if os.path.isdir("/proc/net"):
+        return _find_pids_in_proc(port)
+    return _find_pids_with_lsof(port)
+
+
+def is_process_alive(pid: int) -> bool:
+    """Probe a PID with signal 0, which checks existence without signalling."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists but is owned by another user
+        return True
+    return True
+
+
+def wait_for_exit(pids: List[int], timeout: float) -> List[int]:
+    """
+    Poll PIDs with backoff until they exit or the timeout passes.
+
+    Args:
+        pids: Processes to wait for
+        timeout: Maximum seconds to wait
+
+    Returns:
+        PIDs still alive when the wait ended
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    alive = [pid for pid in pids if is_process_alive(pid)]
+    while alive and time.monotonic() < deadline:
+        time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+        delay *= 2
+        alive = [pid for pid in alive if is_process_alive(pid)]
+    return alive
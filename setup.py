@@ -78,6 +78,8 @@ setup(
         "test": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.3.0",
+            "pytest-benchmark>=4.0.0",
             "httpx>=0.24.0",
             "locust>=2.15.0",
         ],
@@ -2,35 +2,58 @@
 Pytest configuration and fixtures for SimpleCP tests.
 """
 import os
+import pickle
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
 import pytest
 from fastapi.testclient import TestClient
 
-# Set test environment before importing app modules
+# Set test environment before importing app modules; ENVIRONMENT=test also
+# stops Settings from loading .env
 os.environ["ENVIRONMENT"] = "test"
 os.environ["LOG_TO_FILE"] = "false"
 os.environ["ENABLE_SENTRY"] = "false"
 
 from clipboard_manager import ClipboardManager
+from settings import Settings
 from stores.clipboard_item import ClipboardItem
 from api.server import create_app
 
 
+# tmpfs on Linux keeps save/load tests in RAM; elsewhere use the default temp dir
+RAM_TEMP_DIR = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+# Ephemeral CI containers are thrown away whole, so skip the teardown tree walk
+SKIP_CLEANUP = bool(os.environ.get("CI") or os.environ.get("PYTEST_SKIP_CLEANUP"))
+
+
 @pytest.fixture(scope="session")
 def test_data_dir() -> Generator[str, None, None]:
-    """Create temporary directory for test data."""
-    temp_dir = tempfile.mkdtemp(prefix="simplecp_test_")
+    """Create temporary directory for test data (one per xdist worker)."""
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    temp_dir = tempfile.mkdtemp(prefix=f"simplecp_test_{worker_id}_", dir=RAM_TEMP_DIR)
     yield temp_dir
     # Cleanup
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    if not SKIP_CLEANUP:
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 @pytest.fixture
+def test_settings(test_data_dir) -> Settings:
+    """Standalone Settings for tests, built without pydantic validation."""
+    return Settings.for_testing(
+        environment="test",
+        log_to_file=False,
+        enable_sentry=False,
+        data_dir=Path(test_data_dir),
+    )
+
+
+@pytest.fixture(scope="session")
 def clipboard_manager(test_data_dir) -> ClipboardManager:
-    """Create a fresh ClipboardManager instance for testing."""
+    """Create one ClipboardManager for the session; reset_clipboard_manager restores it."""
     manager = ClipboardManager(
         data_dir=test_data_dir,
         max_history=50,
@@ -39,6 +62,60 @@ def clipboard_manager(test_data_dir) -> ClipboardManager:
     return manager
 
 
+@pytest.fixture(scope="session")
+def _clipboard_baseline(clipboard_manager) -> dict:
+    """Snapshot of the manager's state right after construction."""
+    return {
+        "items": list(clipboard_manager.history_store.items),
+        "folders": {
+            name: list(items)
+            for name, items in clipboard_manager.snippet_store.folders.items()
+        },
+        "current_clipboard": clipboard_manager._current_clipboard,
+        "auto_save_enabled": clipboard_manager.auto_save_enabled,
+    }
+
+
+@pytest.fixture(scope="session")
+def _populated_state() -> bytes:
+    """Pickled history and snippets for the scalability tests, built once."""
+    temp_dir = tempfile.mkdtemp(prefix="simplecp_populated_", dir=RAM_TEMP_DIR)
+    try:
+        manager = ClipboardManager(data_dir=temp_dir, max_history=50, display_count=10)
+        manager.auto_save_enabled = False
+        manager.add_clips_bulk(
+            f"Python code example {i}" if i % 3 == 0 else f"Other content {i}"
+            for i in range(100)
+        )
+        for folder_num in range(5):
+            for snippet_num in range(10):
+                manager.add_snippet_direct(
+                    f"Snippet {snippet_num}", f"Note {snippet_num}", f"Folder{folder_num}"
+                )
+        return pickle.dumps(
+            (manager.history_store.items, manager.snippet_store.folders)
+        )
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def populated_manager(clipboard_manager, _populated_state) -> ClipboardManager:
+    """Session clipboard manager loaded with 100 clips and 50 snippets."""
+    clipboard_manager.replace_state(*pickle.loads(_populated_state))
+    return clipboard_manager
+
+
+@pytest.fixture
+def seed_history(clipboard_manager) -> Callable[[int], None]:
+    """Return a function that adds clips "Test 0".."Test n-1" in one bulk insert."""
+
+    def seed(count: int) -> None:
+        clipboard_manager.add_clips_bulk(f"Test {i}" for i in range(count))
+
+    return seed
+
+
 @pytest.fixture
 def sample_clipboard_items() -> list[ClipboardItem]:
     """Create sample clipboard items for testing."""
@@ -53,11 +130,14 @@ def sample_clipboard_items() -> list[ClipboardItem]:
     return items
 
 
-@pytest.fixture
-def api_client(clipboard_manager) -> TestClient:
-    """Create FastAPI test client."""
+@pytest.fixture(scope="session")
+def api_client(clipboard_manager) -> Generator[TestClient, None, None]:
+    """Create one FastAPI test client over the session clipboard manager."""
     app = create_app(clipboard_manager)
-    return TestClient(app)
+    # Entered once: lifespan runs a single time and every request reuses the
+    # same event loop thread instead of starting a new one per call
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture
@@ -72,19 +152,18 @@ def mock_clipboard_content():
 
 
 @pytest.fixture(autouse=True)
-def reset_clipboard_manager(clipboard_manager):
-    """Reset clipboard manager state between tests."""
+def reset_clipboard_manager(clipboard_manager, _clipboard_baseline):
+    """Restore the session clipboard manager to its baseline after each test."""
     yield
-    # Clear stores after each test
-    try:
-        clipboard_manager.history_store.clear()
-    except Exception:
-        pass
-    # SnippetStore doesn't have a clear() method, clear folders manually
-    try:
-        clipboard_manager.snippet_store.folders.clear()
-    except Exception:
-        pass
+    # Swap in fresh copies instead of clear(), which fires delegates
+    clipboard_manager.replace_state(
+        list(_clipboard_baseline["items"]),
+        {name: list(items) for name, items in _clipboard_baseline["folders"].items()},
+    )
+    clipboard_manager.history_store.modified = False
+    clipboard_manager.snippet_store.modified = False
+    clipboard_manager._current_clipboard = _clipboard_baseline["current_clipboard"]
+    clipboard_manager.auto_save_enabled = _clipboard_baseline["auto_save_enabled"]
 
 
 @pytest.fixture
@@ -1,9 +1,13 @@
 """
 Integration tests for complete workflows.
 """
+import time
+
 import pytest
 from fastapi.testclient import TestClient
 
+from clipboard_manager import ClipboardManager
+
 
 @pytest.mark.integration
 class TestClipboardWorkflows:
@@ -34,7 +38,7 @@ class TestClipboardWorkflows:
         # 5. Verify deletion
         response = api_client.get("/api/history")
         history = response.json()
-        assert item.clip_id not in [h["clip_id"] for h in history]
+        assert item.clip_id not in {h["clip_id"] for h in history}
 
     def test_snippet_workflow(self, api_client, clipboard_manager):
         """Test complete snippet workflow."""
@@ -132,8 +136,6 @@ class TestPersistenceWorkflows:
 
     def test_save_and_reload_workflow(self, test_data_dir):
         """Test complete save and reload workflow."""
-        from clipboard_manager import ClipboardManager
-
         # 1. Create manager and add data
         manager1 = ClipboardManager(data_dir=test_data_dir)
         manager1.add_clip("History item 1")
@@ -170,12 +172,8 @@ class TestPersistenceWorkflows:
 class TestScalabilityWorkflows:
     """Test workflows with large amounts of data."""
 
-    def test_large_history_workflow(self, api_client, clipboard_manager):
+    def test_large_history_workflow(self, api_client, populated_manager):
         """Test handling large history."""
-        # Add many items
-        for i in range(100):
-            clipboard_manager.add_clip(f"Test item {i}")
-
         # Should respect max limit
         response = api_client.get("/api/history")
         assert response.status_code == 200
@@ -190,13 +188,21 @@ class TestScalabilityWorkflows:
 
     def test_many_snippets_workflow(self, api_client, clipboard_manager):
         """Test handling many snippets."""
-        # Create multiple folders with snippets
-        for folder_num in range(5):
-            folder = f"Folder{folder_num}"
-            for snippet_num in range(10):
-                clipboard_manager.create_snippet(
-                    f"Snippet {snippet_num}", folder, f"Note {snippet_num}"
-                )
+        # Create multiple folders with snippets in one request
+        payload = {
+            "snippets": [
+                {
+                    "content": f"Snippet {snippet_num}",
+                    "name": f"Note {snippet_num}",
+                    "folder": f"Folder{folder_num}",
+                }
+                for folder_num in range(5)
+                for snippet_num in range(10)
+            ]
+        }
+        response = api_client.post("/api/snippets/bulk", json=payload)
+        assert response.status_code == 200
+        assert len(response.json()) == 50
 
         # Get all snippets
         response = api_client.get("/api/snippets")
@@ -211,18 +217,9 @@ class TestScalabilityWorkflows:
         assert stats["snippet_count"] >= 50
         assert stats["folder_count"] >= 5
 
-    def test_search_performance(self, api_client, clipboard_manager):
+    def test_search_performance(self, api_client, populated_manager):
         """Test search with large dataset."""
-        # Add many items with searchable content
-        for i in range(100):
-            if i % 3 == 0:
-                clipboard_manager.add_clip(f"Python code example {i}")
-            else:
-                clipboard_manager.add_clip(f"Other content {i}")
-
         # Search should complete quickly
-        import time
-
         start = time.time()
         response = api_client.get("/api/search?q=Python")
         duration = time.time() - start
@@ -3,6 +3,7 @@ Performance benchmarks for SimpleCP.
 """
 import pytest
 import time
+import tracemalloc
 from clipboard_manager import ClipboardManager
 
 
@@ -18,47 +19,34 @@ class TestPerformanceBenchmarks:
 
         result = benchmark(add_clip)
 
-    def test_search_performance(self, clipboard_manager, benchmark):
+    def test_search_performance(self, populated_manager, benchmark):
         """Benchmark search operations."""
-        # Prep: Add items to search through
-        for i in range(100):
-            clipboard_manager.add_clip(f"Test content {i} with searchable text")
 
         def search():
-            return clipboard_manager.search_all("searchable")
+            return populated_manager.search_all("Python")
 
         result = benchmark(search)
 
-    def test_get_history_performance(self, clipboard_manager, benchmark):
+    def test_get_history_performance(self, populated_manager, benchmark):
         """Benchmark retrieving history."""
-        # Prep: Add many items
-        for i in range(50):
-            clipboard_manager.add_clip(f"Test {i}")
 
         def get_history():
-            return clipboard_manager.get_all_history()
+            return populated_manager.get_all_history()
 
         result = benchmark(get_history)
 
-    def test_save_stores_performance(self, clipboard_manager, benchmark):
+    def test_save_stores_performance(self, populated_manager, benchmark):
         """Benchmark saving stores to disk."""
-        # Prep: Add data
-        for i in range(50):
-            clipboard_manager.add_clip(f"History {i}")
-        for i in range(20):
-            clipboard_manager.create_snippet(f"Snippet {i}", "Bench", f"Note {i}")
 
         def save():
-            clipboard_manager.save_stores()
+            populated_manager.save_stores()
 
         result = benchmark(save)
 
-    def test_load_stores_performance(self, clipboard_manager, benchmark, test_data_dir):
+    def test_load_stores_performance(self, populated_manager, benchmark, test_data_dir):
         """Benchmark loading stores from disk."""
-        # Prep: Create data and save
-        for i in range(50):
-            clipboard_manager.add_clip(f"History {i}")
-        clipboard_manager.save_stores()
+        # Prep: Save the pre-built data
+        populated_manager.save_stores()
 
         def load():
             new_manager = ClipboardManager(data_dir=test_data_dir)
@@ -68,64 +56,61 @@ class TestPerformanceBenchmarks:
         result = benchmark(load)
 
 
+def assert_endpoint_within(api_client, benchmark, path, target_ms):
+    """Benchmark GET path and fail if its mean time exceeds target_ms."""
+
+    def call():
+        response = api_client.get(path)
+        assert response.status_code == 200
+
+    benchmark.extra_info["target_ms"] = target_ms
+    benchmark(call)
+    # Stats are in seconds; absent when run with --benchmark-disable
+    if benchmark.stats is not None:
+        assert benchmark.stats.stats.mean * 1000 < target_ms
+
+
 @pytest.mark.performance
 @pytest.mark.api
 class TestAPIPerformance:
     """Performance tests for API endpoints."""
 
-    def test_api_history_endpoint_performance(self, api_client, clipboard_manager):
+    def test_api_history_endpoint_performance(self, api_client, populated_manager, benchmark):
         """Test /api/history performance."""
-        # Prep: Add data
-        for i in range(50):
-            clipboard_manager.add_clip(f"Test {i}")
-
-        # Benchmark
-        times = []
-        for _ in range(10):
-            start = time.time()
-            response = api_client.get("/api/history")
-            duration = time.time() - start
-            times.append(duration)
-            assert response.status_code == 200
-
-        avg_time = sum(times) / len(times)
-        assert avg_time < 0.1  # Should complete in under 100ms
-
-    def test_api_search_performance(self, api_client, clipboard_manager):
+        assert_endpoint_within(api_client, benchmark, "/api/history", target_ms=100)
+
+    def test_api_search_performance(self, api_client, populated_manager, benchmark):
         """Test /api/search performance."""
-        # Prep: Add data
-        for i in range(100):
-            clipboard_manager.add_clip(f"Content {i} with searchable keyword")
-
-        # Benchmark
-        times = []
-        for _ in range(10):
-            start = time.time()
-            response = api_client.get("/api/search?q=searchable")
-            duration = time.time() - start
-            times.append(duration)
-            assert response.status_code == 200
-
-        avg_time = sum(times) / len(times)
-        assert avg_time < 0.2  # Should complete in under 200ms
-
-    def test_api_snippets_performance(self, api_client, clipboard_manager):
+        assert_endpoint_within(api_client, benchmark, "/api/search?q=Python", target_ms=200)
+
+    def test_api_snippets_performance(self, api_client, populated_manager, benchmark):
         """Test /api/snippets performance."""
-        # Prep: Add many snippets
-        for i in range(50):
-            clipboard_manager.create_snippet(f"Snippet {i}", "Test", f"Note {i}")
+        assert_endpoint_within(api_client, benchmark, "/api/snippets", target_ms=150)
+
+
+def scalability_contents(count, offset=0):
+    """History contents where every tenth item is a FINDME search target."""
+    return [
+        f"FINDME special content {i}" if i % 10 == 0 else f"Regular content {i}"
+        for i in range(offset, offset + count)
+    ]
+
 
-        # Benchmark
-        times = []
-        for _ in range(10):
-            start = time.time()
-            response = api_client.get("/api/snippets")
-            duration = time.time() - start
-            times.append(duration)
-            assert response.status_code == 200
+@pytest.fixture
+def sized_manager(tmp_path):
+    """
+    Return a function building a fresh manager seeded with `size` clips.
 
-        avg_time = sum(times) / len(times)
-        assert avg_time < 0.15  # Should complete in under 150ms
+    Each case gets its own manager in its own tmp dir, so cases never see
+    each other's writes and can run on separate xdist workers.
+    """
+
+    def build(size):
+        manager = ClipboardManager(data_dir=str(tmp_path), max_history=size)
+        manager.add_clips_bulk(scalability_contents(size))
+        return manager
+
+    return build
 
 
 @pytest.mark.performance
@@ -133,59 +118,47 @@ class TestAPIPerformance:
 class TestScalability:
     """Test scalability with large datasets."""
 
-    def test_large_history_handling(self, test_data_dir):
-        """Test handling very large history."""
-        manager = ClipboardManager(data_dir=test_data_dir, max_history=500)
-
-        # Add many items
+    @pytest.mark.parametrize("size", [500])
+    def test_scalability_add(self, sized_manager, size):
+        """Adding twice max_history clips stays fast and respects the limit."""
+        manager = sized_manager(size)
+        contents = scalability_contents(2 * size, offset=size)
         start = time.time()
-        for i in range(1000):
-            manager.add_clip(f"Large test {i}")
+        for content in contents:
+            manager.add_clip(content)
         duration = time.time() - start
 
         # Should handle efficiently (under 5 seconds for 1000 items)
         assert duration < 5.0
-
         # Should respect max_history
-        assert len(manager.history_store) <= 500
-
-    def test_many_snippets_handling(self, test_data_dir):
-        """Test handling many snippets."""
-        manager = ClipboardManager(data_dir=test_data_dir)
+        assert len(manager.history_store) == size
 
-        # Create many snippets across folders
+    @pytest.mark.parametrize("size", [500])
+    def test_scalability_snippets(self, sized_manager, size):
+        """Creating many snippets across folders stays fast."""
+        manager = sized_manager(size)
         start = time.time()
-        for folder_num in range(10):
-            folder = f"Folder{folder_num}"
-            for i in range(50):
-                manager.create_snippet(f"Content {i}", folder, f"Note {i}")
+        for i in range(size):
+            manager.add_snippet_direct(f"Content {i}", f"Note {i}", f"Folder{i % 10}")
         duration = time.time() - start
 
         # Should complete in reasonable time
         assert duration < 10.0
-
         # Verify all created
         all_snippets = manager.get_all_snippets()
-        assert len(all_snippets) >= 500
-
-    def test_search_scalability(self, test_data_dir):
-        """Test search with very large dataset."""
-        manager = ClipboardManager(data_dir=test_data_dir, max_history=500)
+        assert sum(len(items) for items in all_snippets.values()) == size
 
-        # Add diverse content
-        for i in range(500):
-            if i % 10 == 0:
-                manager.add_clip(f"FINDME special content {i}")
-            else:
-                manager.add_clip(f"Regular content {i}")
-
-        # Search should still be fast
+    @pytest.mark.parametrize("size", [500, 5000])
+    def test_scalability_search(self, sized_manager, size):
+        """Searching a history of `size` clips finds every target quickly."""
+        manager = sized_manager(size)
         start = time.time()
         results = manager.search_all("FINDME")
         duration = time.time() - start
 
         assert duration < 1.0  # Should complete in under 1 second
-        assert len(results["history"]) >= 40  # Should find ~50 matches
+        # Every tenth clip is a target
+        assert len(results["history"]) == size // 10
 
 
 @pytest.mark.performance
@@ -193,21 +166,20 @@ class TestMemoryEfficiency:
     """Test memory efficiency."""
 
     def test_memory_usage_bounds(self, test_data_dir):
-        """Test that memory usage stays reasonable."""
-        import sys
-
+        """Test that memory retained by added history stays reasonable."""
         manager = ClipboardManager(data_dir=test_data_dir, max_history=100)
 
-        # Get baseline size
-        baseline_size = sys.getsizeof(manager)
+        # Measure retained heap, not the manager's shallow object size
+        tracemalloc.start()
+        try:
+            baseline, _ = tracemalloc.get_traced_memory()
 
-        # Add content
-        for i in range(100):
-            manager.add_clip(f"Test content {i}" * 10)  # Longer content
+            # Add content
+            manager.add_clips_bulk(f"Test content {i}" * 10 for i in range(100))  # Longer content
 
-        # Size should not grow excessively
-        final_size = sys.getsizeof(manager)
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
 
-        # Note: This is a basic check; proper memory profiling would be more comprehensive
-        # Just ensure we're not leaking memory catastrophically
-        assert final_size < baseline_size * 1000  # Generous bound
+        # 100 clips of ~150 chars plus metadata; 10 MB would mean a leak
+        assert current - baseline < 10_000_000
@@ -4,6 +4,9 @@ Unit tests for API endpoints.
 import pytest
 from fastapi.testclient import TestClient
 
+from api.server import create_app
+from settings import settings
+
 
 @pytest.mark.api
 class TestAPIEndpoints:
@@ -27,38 +30,24 @@ class TestAPIEndpoints:
         assert "version" in data
         assert "clipboard_stats" in data
 
-    def test_get_history(self, api_client, clipboard_manager):
-        """Test getting history."""
-        # Add some history
-        for i in range(5):
-            clipboard_manager.add_clip(f"Test {i}")
-
-        response = api_client.get("/api/history")
+    @pytest.mark.parametrize(
+        "count,url,expected_len",
+        [
+            (5, "/api/history", 5),
+            (10, "/api/history?limit=5", 5),
+            (15, "/api/history/recent", 10),  # capped at display_count
+        ],
+        ids=["all", "limit", "recent"],
+    )
+    def test_get_history(self, api_client, seed_history, count, url, expected_len):
+        """Test history listings after seeding count clips."""
+        seed_history(count)
+
+        response = api_client.get(url)
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
-        assert len(data) == 5
-
-    def test_get_history_with_limit(self, api_client, clipboard_manager):
-        """Test getting history with limit."""
-        for i in range(10):
-            clipboard_manager.add_clip(f"Test {i}")
-
-        response = api_client.get("/api/history?limit=5")
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 5
-
-    def test_get_recent_history(self, api_client, clipboard_manager):
-        """Test getting recent history."""
-        for i in range(15):
-            clipboard_manager.add_clip(f"Test {i}")
-
-        response = api_client.get("/api/history/recent")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) <= 10
+        assert len(data) == expected_len
 
     def test_delete_history_item(self, api_client, clipboard_manager):
         """Test deleting history item."""
@@ -74,10 +63,9 @@ class TestAPIEndpoints:
         response = api_client.delete("/api/history/invalid-id")
         assert response.status_code == 404
 
-    def test_clear_all_history(self, api_client, clipboard_manager):
+    def test_clear_all_history(self, api_client, clipboard_manager, seed_history):
         """Test clearing all history."""
-        for i in range(5):
-            clipboard_manager.add_clip(f"Test {i}")
+        seed_history(5)
 
         response = api_client.delete("/api/history")
         assert response.status_code == 200
@@ -198,10 +186,9 @@ class TestAPIEndpoints:
         assert "snippet_count" in data
         assert "folder_count" in data
 
-    def test_get_history_folders(self, api_client, clipboard_manager):
+    def test_get_history_folders(self, api_client, seed_history):
         """Test getting auto-generated history folders."""
-        for i in range(25):
-            clipboard_manager.add_clip(f"Test {i}")
+        seed_history(25)
 
         response = api_client.get("/api/history/folders")
         assert response.status_code == 200
@@ -221,12 +208,20 @@ class TestAPIEndpoints:
         assert "Work" in data
         assert "Personal" in data
 
-    def test_performance_header(self, api_client):
-        """Test that performance headers are added."""
-        response = api_client.get("/api/stats")
+    def test_performance_header(self, clipboard_manager, monkeypatch):
+        """Test that performance headers are added in development."""
+        monkeypatch.setattr(settings, "environment", "development")
+        client = TestClient(create_app(clipboard_manager))
+        response = client.get("/api/stats")
         assert response.status_code == 200
         assert "X-Process-Time" in response.headers
 
+    def test_performance_header_hidden_outside_development(self, api_client):
+        """Test that performance headers are omitted outside development."""
+        response = api_client.get("/api/stats")
+        assert response.status_code == 200
+        assert "X-Process-Time" not in response.headers
+
     def test_cors_headers(self, api_client):
         """Test CORS headers are present."""
         response = api_client.options("/api/history")
@@ -84,29 +84,31 @@ class TestClipboardItem:
         assert item.content == "Test content"
         assert item.content_type == "text"
 
-    def test_detect_content_type_url(self):
-        """Test URL content type detection."""
-        urls = [
+    @pytest.mark.parametrize(
+        "url",
+        [
             "https://example.com",
             "http://test.org",
             "https://github.com/user/repo",
-        ]
-
-        for url in urls:
-            item = ClipboardItem(content=url)
-            assert item.content_type == "url"
+        ],
+    )
+    def test_detect_content_type_url(self, url):
+        """Test URL content type detection."""
+        item = ClipboardItem(content=url)
+        assert item.content_type == "url"
 
-    def test_detect_content_type_code(self):
-        """Test code content type detection."""
-        code_samples = [
+    @pytest.mark.parametrize(
+        "code",
+        [
             "def hello():\n    pass",
             "function test() {}",
             "class MyClass:",
-        ]
-
-        for code in code_samples:
-            item = ClipboardItem(content=code)
-            assert item.content_type == "code"
+        ],
+    )
+    def test_detect_content_type_code(self, code):
+        """Test code content type detection."""
+        item = ClipboardItem(content=code)
+        assert item.content_type == "code"
 
     def test_detect_content_type_json(self):
         """Test JSON content type detection."""
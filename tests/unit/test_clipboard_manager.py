@@ -2,11 +2,20 @@
 Unit tests for ClipboardManager class.
 """
 import pytest
-from unittest.mock import patch, MagicMock
 from clipboard_manager import ClipboardManager
 from stores.clipboard_item import ClipboardItem
 
 
+@pytest.fixture(autouse=True, scope="module")
+def fake_clipboard():
+    """Replace the system clipboard with a dict for the whole module."""
+    clipboard = {"value": ""}
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("pyperclip.paste", lambda: clipboard["value"])
+        mp.setattr("pyperclip.copy", lambda value: clipboard.__setitem__("value", value))
+        yield clipboard
+
+
 @pytest.mark.unit
 class TestClipboardManager:
     """Test ClipboardManager functionality."""
@@ -36,19 +45,17 @@ class TestClipboardManager:
         assert item is None
         assert len(clipboard_manager.history_store) == 0
 
-    @patch("pyperclip.paste")
-    def test_check_clipboard(self, mock_paste, clipboard_manager):
+    def test_check_clipboard(self, fake_clipboard, clipboard_manager):
         """Test clipboard checking."""
-        mock_paste.return_value = "New content"
+        fake_clipboard["value"] = "New content"
 
         item = clipboard_manager.check_clipboard()
         assert item is not None
         assert item.content == "New content"
 
-    @patch("pyperclip.paste")
-    def test_check_clipboard_no_change(self, mock_paste, clipboard_manager):
+    def test_check_clipboard_no_change(self, fake_clipboard, clipboard_manager):
         """Test clipboard check with no change."""
-        mock_paste.return_value = "Same content"
+        fake_clipboard["value"] = "Same content"
 
         # First check
         item1 = clipboard_manager.check_clipboard()
@@ -58,40 +65,36 @@ class TestClipboardManager:
         item2 = clipboard_manager.check_clipboard()
         assert item2 is None  # No new item
 
-    @patch("pyperclip.copy")
-    def test_copy_to_clipboard(self, mock_copy, clipboard_manager):
+    def test_copy_to_clipboard(self, fake_clipboard, clipboard_manager):
         """Test copying item to system clipboard."""
         item = clipboard_manager.add_clip("Test content")
 
         success = clipboard_manager.copy_to_clipboard(item.clip_id)
         assert success is True
-        mock_copy.assert_called_once_with("Test content")
+        assert fake_clipboard["value"] == "Test content"
 
     def test_copy_invalid_id(self, clipboard_manager):
         """Test copying with invalid ID."""
         success = clipboard_manager.copy_to_clipboard("invalid-id")
         assert success is False
 
-    def test_get_all_history(self, clipboard_manager):
+    def test_get_all_history(self, clipboard_manager, seed_history):
         """Test getting all history items."""
-        for i in range(5):
-            clipboard_manager.add_clip(f"Test {i}")
+        seed_history(5)
 
         items = clipboard_manager.get_all_history()
         assert len(items) == 5
 
-    def test_get_all_history_with_limit(self, clipboard_manager):
+    def test_get_all_history_with_limit(self, clipboard_manager, seed_history):
         """Test getting history with limit."""
-        for i in range(10):
-            clipboard_manager.add_clip(f"Test {i}")
+        seed_history(10)
 
         items = clipboard_manager.get_all_history(limit=5)
         assert len(items) == 5
 
-    def test_get_recent_history(self, clipboard_manager):
+    def test_get_recent_history(self, clipboard_manager, seed_history):
         """Test getting recent history for display."""
-        for i in range(15):
-            clipboard_manager.add_clip(f"Test {i}")
+        seed_history(15)
 
         recent = clipboard_manager.get_recent_history()
         assert len(recent) <= clipboard_manager.display_count
@@ -104,10 +107,9 @@ class TestClipboardManager:
         assert success is True
         assert len(clipboard_manager.history_store) == 0
 
-    def test_clear_all_history(self, clipboard_manager):
+    def test_clear_all_history(self, clipboard_manager, seed_history):
         """Test clearing all history."""
-        for i in range(5):
-            clipboard_manager.add_clip(f"Test {i}")
+        seed_history(5)
 
         clipboard_manager.clear_history()
         assert len(clipboard_manager.history_store) == 0
@@ -185,10 +187,9 @@ class TestClipboardManager:
         assert len(results["history"]) >= 1
         assert len(results["snippets"]) >= 1
 
-    def test_get_stats(self, clipboard_manager):
+    def test_get_stats(self, clipboard_manager, seed_history):
         """Test getting statistics."""
-        for i in range(3):
-            clipboard_manager.add_clip(f"Test {i}")
+        seed_history(3)
 
         clipboard_manager.create_snippet("Snippet", "Work", "Note")
 
@@ -198,6 +199,7 @@ class TestClipboardManager:
         assert "folder_count" in stats
         assert "max_history" in stats
 
+    @pytest.mark.slow
     def test_save_and_load_stores(self, clipboard_manager, test_data_dir):
         """Test persistence of stores."""
         # Add some data
@@ -214,6 +216,7 @@ class TestClipboardManager:
         assert len(new_manager.history_store) == 1
         assert len(new_manager.snippet_store.get_all_snippets()) == 1
 
+    @pytest.mark.slow
     def test_max_history_enforcement(self, test_data_dir):
         """Test that max_history limit is enforced."""
         manager = ClipboardManager(data_dir=test_data_dir, max_history=5)